@@ -6,7 +6,7 @@ import time
 import schedule
 
 # Import configuration
-from config.settings import FLASK_PORT, FLASK_ENV
+from config.settings import FLASK_PORT, FLASK_ENV, LIVE_POLLER_ENABLED
 
 # Import routes
 from routes.api_routes import api_bp
@@ -15,9 +15,15 @@ from routes.api_routes import api_bp
 from services.news_processor import NewsProcessingService
 from utils.scheduler import NewsScheduler
 from services.global_database import global_db  # NEW: Global database service
+from services.live_feed_poller import live_feed_poller
+from utils.worker_pool import cpu_pool
 
 def create_app():
     """Application factory pattern"""
+    # Fork the warm CPU workers before any service starts a thread (also under gunicorn,
+    # which calls the factory instead of main)
+    cpu_pool.start()
+    
     app = Flask(__name__)
     CORS(app)
     
@@ -57,7 +63,7 @@ def run_global_scheduler():
 
 def main():
     """Main application entry point"""
-    # Create Flask app
+    # Create Flask app (starts the CPU worker pool first)
     app = create_app()
     
     # Initialize services
@@ -76,6 +82,10 @@ def main():
     print("Starting background scheduler...")
     scheduler.start_scheduler()
     
+    # Keep the live feed ring buffer filled for /api/live-feed?since=<cursor>
+    if LIVE_POLLER_ENABLED:
+        live_feed_poller.start()
+    
     # Initial crawl with global database storage
     print("Performing initial news crawl...")
     try:
@@ -85,11 +95,16 @@ def main():
     
     # Start Flask app
     print(f"🌐 Starting Flask server on port {FLASK_PORT}")
-    app.run(
-        host='0.0.0.0',
-        port=FLASK_PORT,
-        debug=(FLASK_ENV == 'development')
-    )
+    try:
+        app.run(
+            host='0.0.0.0',
+            port=FLASK_PORT,
+            debug=(FLASK_ENV == 'development')
+        )
+    finally:
+        # Server stopped (Ctrl+C): finish in-flight polls and let the CPU workers exit
+        live_feed_poller.stop()
+        cpu_pool.shutdown()
 
 if __name__ == '__main__':
     main()
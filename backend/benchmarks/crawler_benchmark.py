@@ -0,0 +1,249 @@
+"""Crawler throughput benchmark against a local stand-in news server.
+
+Runs NewsScraperService, LiveFeedScraperService and NewsProcessingService against
+synthetic homepages, article pages and RSS feeds served from localhost and writes
+headlines/sec, bytes/sec, p50/p99 per-source latency and peak RSS to JSON.
+
+    cd backend && python -m benchmarks.crawler_benchmark --sources 30 --output bench/results.json
+
+Caches live in a temporary CACHE_DIR and each scenario crawls its own URL scope, so
+the first run of each scenario is cold and later runs show the conditional-GET / image-cache / seen-index paths. The
+supabase and psycopg2 clients are replaced with offline stand-ins before the app modules
+are imported, so no credentials, database or network beyond localhost are needed.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import types
+import concurrent.futures
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Crawler throughput benchmark with a local news server')
+    parser.add_argument('--sources', type=int, default=20, help='Synthetic news sources (homepage + feed each)')
+    parser.add_argument('--headlines-per-page', type=int, default=40)
+    parser.add_argument('--feed-items', type=int, default=20)
+    parser.add_argument('--article-kb', type=int, default=60, help='Approximate size of each article page')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='Artificial server latency per response')
+    parser.add_argument('--no-validators', action='store_true', help='Do not send ETags (every fetch is a full 200)')
+    parser.add_argument('--iterations', type=int, default=2, help='Runs per scenario; run 1 is cold')
+    parser.add_argument('--concurrency', type=int, default=8, help='Parallel sources in the scraper scenario')
+    parser.add_argument('--scenarios', default='scraper,live_feed,processor')
+    parser.add_argument('--output', default='', help='JSON results file (stdout when empty)')
+    return parser.parse_args()
+
+def configure_environment():
+    """Isolated caches and a scheduler that does not throttle the single local host"""
+    os.environ.setdefault('CACHE_DIR', tempfile.mkdtemp(prefix='newslie-bench-'))
+    os.environ.setdefault('HOST_REQUEST_RATE', '10000')
+    os.environ.setdefault('HOST_REQUEST_BURST', '10000')
+    os.environ.setdefault('HOST_MAX_CONCURRENCY', '64')
+    # Benchmarks must never replay or record production traffic by accident
+    os.environ['HTTP_ARCHIVE_MODE'] = ''
+
+def offline_databases():
+    """Stand-in supabase and psycopg2 modules: importing services/ connects to both at import time"""
+    class Query:
+        """Accepts any query-builder chain; execute() returns an empty result"""
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: self
+
+        def execute(self):
+            return types.SimpleNamespace(data=[], count=0)
+
+    supabase = types.ModuleType('supabase')
+    supabase.Client = object
+    supabase.create_client = lambda url, key: types.SimpleNamespace(table=lambda name: Query())
+
+    psycopg2 = types.ModuleType('psycopg2')
+    psycopg2.extras = types.ModuleType('psycopg2.extras')
+    psycopg2.extras.RealDictCursor = object
+    psycopg2.connect = lambda *args, **kwargs: types.SimpleNamespace(
+        closed=False, commit=lambda: None, rollback=lambda: None
+    )
+
+    sys.modules.update({'supabase': supabase, 'psycopg2': psycopg2, 'psycopg2.extras': psycopg2.extras})
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(fraction * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+def peak_rss_mb():
+    """Peak resident set size (MB) of this process and of its finished worker processes"""
+    unit = 1 if sys.platform == 'darwin' else 1024  # ru_maxrss is bytes on macOS, KiB on Linux
+    return tuple(
+        round(resource.getrusage(who).ru_maxrss * unit / (1024 * 1024), 1)
+        for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)
+    )
+
+def timed(target, method_name, latencies):
+    """Wrap an instance method so each call's wall time is appended to latencies"""
+    method = getattr(target, method_name)
+
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    setattr(target, method_name, wrapper)
+
+def summarize(server, headlines, elapsed, latencies):
+    process_peak, workers_peak = peak_rss_mb()
+    return {
+        'headlines': headlines,
+        'elapsed_seconds': round(elapsed, 3),
+        'headlines_per_second': round(headlines / elapsed, 2) if elapsed else 0,
+        'requests': server.requests,
+        'bytes': server.bytes_sent,
+        'bytes_per_second': round(server.bytes_sent / elapsed) if elapsed else 0,
+        'sources_timed': len(latencies),
+        'latency_p50_ms': round(percentile(latencies, 0.50) * 1000, 1),
+        'latency_p99_ms': round(percentile(latencies, 0.99) * 1000, 1),
+        'peak_rss_mb': process_peak,
+        'peak_worker_rss_mb': workers_peak
+    }
+
+def run_scraper(server, site, args):
+    """NewsScraperService.scrape_headlines over every homepage and feed, in parallel"""
+    from services.news_scraper import NewsScraperService
+
+    scraper = NewsScraperService()
+    urls = [server.url(site.homepage_path(source), '/scraper') for source in range(site.sources)]
+    urls += [server.url(site.feed_path(source), '/scraper') for source in range(site.sources)]
+    latencies = []
+    timed(scraper, 'scrape_headlines', latencies)
+
+    started = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(lambda url: scraper.scrape_headlines(url, 'benchmark'), urls))
+    elapsed = time.perf_counter() - started
+
+    return summarize(server, sum(len(headlines) for headlines in results), elapsed, latencies)
+
+def run_live_feed(server, site, args):
+    """LiveFeedScraperService.get_quick_headlines with the synthetic feeds as live sources"""
+    from services.live_feed_scraper import LiveFeedScraperService
+
+    live_scraper = LiveFeedScraperService()
+    live_scraper.live_sources = {
+        'benchmark': [server.url(site.feed_path(source), '/live_feed') for source in range(site.sources)]
+    }
+    latencies = []
+    # Every live fetch the circuit breaker lets through, whichever path submitted it
+    timed(live_scraper, '_fetch_allowed', latencies)
+
+    started = time.perf_counter()
+    headlines = live_scraper.get_quick_headlines(limit=site.sources * site.feed_items)
+    elapsed = time.perf_counter() - started
+
+    return summarize(server, len(headlines), elapsed, latencies)
+
+def run_processor(server, site, args):
+    """NewsProcessingService.crawl_and_process_news over the synthetic homepages and feeds"""
+    from services import news_processor
+    from services.supabase_client import supabase_db
+    from services.global_database import global_db
+
+    # Measure the crawl, not the remote databases
+    supabase_db.store_headline = lambda news_item: True
+    global_db.store_global_update = lambda headlines: 'benchmark'
+
+    news_processor.NEWS_SOURCES = {
+        'homepages': [server.url(site.homepage_path(source), '/processor') for source in range(site.sources)],
+        'feeds': [server.url(site.feed_path(source), '/processor') for source in range(site.sources)]
+    }
+
+    processor = news_processor.NewsProcessingService()
+    latencies = []
+    timed(processor.scraper, 'fetch_source_page', latencies)
+
+    started = time.perf_counter()
+    headline_count = processor.crawl_and_process_news()
+    elapsed = time.perf_counter() - started
+
+    result = summarize(server, headline_count, elapsed, latencies)
+    result['pipeline_stats'] = processor.crawl_engine.get_stats()
+    return result
+
+SCENARIOS = {
+    'scraper': run_scraper,
+    'live_feed': run_live_feed,
+    'processor': run_processor
+}
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return 'unknown'
+
+def main():
+    args = parse_args()
+    configure_environment()
+    offline_databases()
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from benchmarks.news_server import SyntheticNewsSite, LocalNewsServer
+
+    site = SyntheticNewsSite(
+        sources=args.sources, headlines_per_page=args.headlines_per_page,
+        feed_items=args.feed_items, article_kb=args.article_kb
+    )
+    server = LocalNewsServer(site, latency=args.latency_ms / 1000, validators=not args.no_validators).start()
+    print(f"📊 Synthetic news server on {server.origin} ({args.sources} sources)")
+
+    results = {
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'config': vars(args),
+        'scenarios': {}
+    }
+
+    try:
+        for name in [name.strip() for name in args.scenarios.split(',') if name.strip()]:
+            if name not in SCENARIOS:
+                print(f"⚠️ Unknown scenario {name} - skipping")
+                continue
+
+            runs = []
+            for iteration in range(args.iterations):
+                server.reset_stats()
+                run = SCENARIOS[name](server, site, args)
+                run['run'] = iteration + 1
+                runs.append(run)
+                print(
+                    f"✅ {name} run {iteration + 1}: {run['headlines']} headlines, "
+                    f"{run['headlines_per_second']}/s, {run['bytes_per_second']} B/s, "
+                    f"p50 {run['latency_p50_ms']}ms, p99 {run['latency_p99_ms']}ms, peak RSS {run['peak_rss_mb']}MB"
+                )
+            results['scenarios'][name] = runs
+    finally:
+        server.stop()
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+        print(f"✅ Results written to {args.output}")
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+import hashlib
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+WORDS = [
+    'council', 'markets', 'climate', 'league', 'senate', 'gallery', 'startup', 'storm',
+    'budget', 'championship', 'museum', 'chip', 'election', 'harvest', 'festival', 'rally',
+    'merger', 'drought', 'coach', 'satellite', 'minister', 'exhibit', 'earnings', 'wildfire',
+    'regulators', 'striker', 'orchestra', 'battery', 'governor', 'glacier', 'lawmakers', 'tariffs'
+]
+VERBS = ['approves', 'rejects', 'expands', 'delays', 'unveils', 'weighs', 'wins', 'faces', 'boosts', 'cuts']
+
+class SyntheticNewsSite:
+    """Deterministic synthetic news content: homepages, article pages and RSS feeds"""
+
+    def __init__(self, sources=20, headlines_per_page=40, feed_items=20, article_kb=60, seed=7):
+        self.sources = sources
+        self.headlines_per_page = headlines_per_page
+        self.feed_items = feed_items
+        self.article_kb = article_kb
+        self.seed = seed
+        self.pages = {}
+        self.lock = threading.Lock()
+
+    def homepage_path(self, source):
+        return f"/site/{source}/"
+
+    def feed_path(self, source):
+        return f"/site/{source}/rss.xml"
+
+    def article_path(self, source, article):
+        return f"/site/{source}/story/{article}"
+
+    def page(self, path):
+        """(content type, body) for a path, or None; pages are rendered once and kept"""
+        with self.lock:
+            if path in self.pages:
+                return self.pages[path]
+
+        page = self._render(path)
+        if page is not None:
+            with self.lock:
+                self.pages[path] = page
+        return page
+
+    def _render(self, path):
+        parts = path.strip('/').split('/')
+        if len(parts) < 2 or parts[0] != 'site' or not parts[1].isdigit() or int(parts[1]) >= self.sources:
+            return None
+
+        source = int(parts[1])
+        if len(parts) == 2:
+            return 'text/html; charset=utf-8', self._homepage(source)
+        if parts[2:] == ['rss.xml']:
+            return 'application/rss+xml; charset=utf-8', self._feed(source)
+        if len(parts) == 4 and parts[2] == 'story' and parts[3].isdigit():
+            return 'text/html; charset=utf-8', self._article(source, int(parts[3]))
+        return None
+
+    def headline(self, source, article):
+        """Stable headline text for one article"""
+        rng = random.Random(f"{self.seed}-{source}-{article}")
+        subject = ' '.join(rng.sample(WORDS, 2)).capitalize()
+        return f"{subject} {rng.choice(VERBS)} {' '.join(rng.sample(WORDS, 3))} plan {source}-{article}"
+
+    def _homepage(self, source):
+        # Links are relative so a site mounted under a scope prefix stays self-contained
+        links = ''.join(
+            f'<article class="story"><h2><a href="story/{article}">'
+            f'{self.headline(source, article)}</a></h2><p>{self._paragraph(source, article, 2)}</p></article>'
+            for article in range(self.headlines_per_page)
+        )
+        nav = ''.join(f'<li><a href="category/{word}">{word}</a></li>' for word in WORDS[:12])
+        return (
+            f'<!DOCTYPE html><html><head><title>Synthetic source {source}</title>'
+            f'<script>var analytics = {{"source": {source}}};</script></head>'
+            f'<body><nav><ul>{nav}</ul></nav><main>{links}</main>'
+            f'<footer><a href="privacy">Privacy policy</a></footer></body></html>'
+        ).encode('utf-8')
+
+    def _article(self, source, article):
+        body = []
+        size = 0
+        paragraph = 0
+        while size < self.article_kb * 1024:
+            text = f'<p>{self._paragraph(source, article + paragraph, 12)}</p>'
+            body.append(text)
+            size += len(text)
+            paragraph += 1
+
+        return (
+            f'<!DOCTYPE html><html><head><title>{self.headline(source, article)}</title>'
+            f'<meta property="og:title" content="{self.headline(source, article)}">'
+            f'<meta property="og:image" content="../images/{article}.jpg">'
+            f'<link rel="stylesheet" href="../static/site.css"></head>'
+            f'<body><article><h1>{self.headline(source, article)}</h1>'
+            f'<img src="../images/{article}-inline.jpg">{"".join(body)}</article></body></html>'
+        ).encode('utf-8')
+
+    def _feed(self, source):
+        items = ''.join(
+            f'<item><title>{self.headline(source, article)}</title>'
+            f'<link>{{base}}{self.article_path(source, article)}</link>'
+            f'<description>{self._paragraph(source, article, 1)}</description>'
+            f'<pubDate>{time.strftime("%a, %d %b %Y %H:%M:%S +0000", time.gmtime(1700000000 - article * 600))}</pubDate>'
+            f'</item>'
+            for article in range(self.feed_items)
+        )
+        return (
+            f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f'<title>Synthetic feed {source}</title><link>{{base}}{self.homepage_path(source)}</link>{items}'
+            f'</channel></rss>'
+        ).encode('utf-8')
+
+    def _paragraph(self, source, article, sentences):
+        rng = random.Random(f"{self.seed}-{source}-{article}-text")
+        return ' '.join(
+            ' '.join(rng.choice(WORDS) for _ in range(12)).capitalize() + '.'
+            for _ in range(sentences)
+        )
+
+class _NewsRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive, like real news sites
+
+    def do_GET(self):
+        server = self.server
+        # Anything before /site/ is a scope prefix: each scope is an independent copy of the site
+        path = self.path.split('?')[0]
+        scope, found, site_path = path.partition('/site/')
+        page = server.site.page('/site/' + site_path) if found else None
+        if server.latency:
+            time.sleep(server.latency)
+
+        if page is None:
+            self._respond(404, 'text/plain', b'not found')
+            return
+
+        content_type, body = page
+        # Feeds carry absolute links, which depend on the server address and the scope
+        body = body.replace(b'{base}', (server.origin + scope).encode('ascii'))
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+
+        if server.validators and self.headers.get('If-None-Match') == etag:
+            self._respond(304, content_type, b'', etag)
+        else:
+            self._respond(200, content_type, body, etag)
+
+    def _respond(self, status, content_type, body, etag=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if etag and self.server.validators:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+        self.server.count(len(body))
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output readable
+
+class LocalNewsServer(ThreadingHTTPServer):
+    """Threaded HTTP server for a SyntheticNewsSite on localhost, counting requests and bytes"""
+
+    daemon_threads = True
+
+    def __init__(self, site, port=0, latency=0.0, validators=True):
+        super().__init__(('127.0.0.1', port), _NewsRequestHandler)
+        self.site = site
+        self.latency = latency
+        self.validators = validators  # Send ETags and answer If-None-Match with 304
+        self.origin = f"http://127.0.0.1:{self.server_address[1]}"
+        self.stats_lock = threading.Lock()
+        self.thread = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.requests = 0
+            self.bytes_sent = 0
+
+    def count(self, body_bytes):
+        with self.stats_lock:
+            self.requests += 1
+            self.bytes_sent += body_bytes
+
+    def handle_error(self, request, client_address):
+        # Streaming image extraction hangs up after </head>; that is expected, not an error
+        if not isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            super().handle_error(request, client_address)
+
+    def url(self, path, scope=''):
+        """Absolute URL of a site path, optionally under a scope prefix such as '/scraper'"""
+        return self.origin + scope + path
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
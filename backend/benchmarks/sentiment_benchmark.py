@@ -0,0 +1,144 @@
+"""Sentiment backend benchmark and tolerance check: TextBlob vs the NumPy lexicon engine.
+
+Scores the same headlines with TextBlob (one blob per headline) and with
+utils.lexicon_sentiment (one vectorized batch), writes headlines/sec for both and
+the largest polarity difference to JSON, and exits non-zero when that difference
+is above --tolerance.
+
+    cd backend && python -m benchmarks.sentiment_benchmark --headlines 20000 --output bench/sentiment.json
+
+Headlines are synthetic (seeded) unless --input names a file with one headline per line.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+# Words that carry sentiment in TextBlob's lexicon, plus modifiers and negations
+ADJECTIVES = [
+    'good', 'bad', 'great', 'terrible', 'strong', 'weak', 'stunning', 'tragic', 'historic', 'worst',
+    'best', 'surprising', 'dangerous', 'happy', 'sad', 'major', 'huge', 'rare', 'deadly', 'positive',
+    'negative', 'new', 'old', 'big', 'poor', 'rich', 'fresh', 'fierce', 'brilliant', 'awful'
+]
+MODIFIERS = ['very', 'really', 'extremely', 'remarkably', 'incredibly', 'so', 'too', 'highly']
+NEGATIONS = ['not', 'no', 'never', "isn't", "won't", "doesn't"]
+ENDINGS = ['', '', '', '!', '?', '...', ' amid fears', ' as talks stall', ', officials say']
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Compare TextBlob and the NumPy lexicon sentiment engine')
+    parser.add_argument('--headlines', type=int, default=10000, help='Synthetic headlines to score')
+    parser.add_argument('--input', default='', help='File with one headline per line (instead of synthetic ones)')
+    parser.add_argument('--tolerance', type=float, default=1e-6, help='Largest allowed polarity difference')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per backend; the fastest is reported')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', default='', help='JSON results file (stdout when empty)')
+    return parser.parse_args()
+
+def synthetic_headlines(count, seed):
+    """Deterministic headlines mixing news vocabulary with modifiers, negations and '!'"""
+    from benchmarks.news_server import WORDS, VERBS
+
+    rng = random.Random(seed)
+    headlines = []
+    for _ in range(count):
+        words = [' '.join(rng.sample(WORDS, 2)).capitalize(), rng.choice(VERBS)]
+        for _ in range(rng.randint(1, 3)):
+            if rng.random() < 0.25:
+                words.append(rng.choice(NEGATIONS))
+            if rng.random() < 0.4:
+                words.append(rng.choice(MODIFIERS))
+            words.append(rng.choice(ADJECTIVES))
+            words.append(rng.choice(WORDS))
+        headlines.append(' '.join(words) + rng.choice(ENDINGS))
+    return headlines
+
+def best_time(func, repeat):
+    """(fastest wall time of repeat calls, result of the last call)"""
+    best, result = None, None
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main():
+    args = parse_args()
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from textblob import TextBlob
+    from utils.lexicon_sentiment import lexicon_sentiment
+    from benchmarks.crawler_benchmark import git_commit
+
+    if not lexicon_sentiment.available:
+        print("❌ Lexicon engine unavailable with this TextBlob version")
+        sys.exit(1)
+
+    if args.input:
+        with open(args.input, encoding='utf-8') as f:
+            headlines = [line.strip() for line in f if line.strip()]
+    else:
+        headlines = synthetic_headlines(args.headlines, args.seed)
+    print(f"📊 Scoring {len(headlines)} headlines")
+
+    started = time.perf_counter()
+    lexicon_sentiment.load()
+    load_seconds = time.perf_counter() - started
+
+    textblob_seconds, expected = best_time(
+        lambda: [TextBlob(headline).sentiment.polarity for headline in headlines], args.repeat
+    )
+    lexicon_seconds, actual = best_time(lambda: lexicon_sentiment.polarity(headlines), args.repeat)
+
+    errors = [abs(float(got) - want) for got, want in zip(actual, expected)]
+    max_error = max(errors, default=0.0)
+    worst = errors.index(max_error) if errors else None
+
+    results = {
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'config': vars(args),
+        'headlines': len(headlines),
+        'lexicon_load_seconds': round(load_seconds, 3),
+        'textblob': {
+            'elapsed_seconds': round(textblob_seconds, 3),
+            'headlines_per_second': round(len(headlines) / textblob_seconds, 1) if textblob_seconds else 0
+        },
+        'lexicon': {
+            'elapsed_seconds': round(lexicon_seconds, 3),
+            'headlines_per_second': round(len(headlines) / lexicon_seconds, 1) if lexicon_seconds else 0
+        },
+        'speedup': round(textblob_seconds / lexicon_seconds, 2) if lexicon_seconds else 0,
+        'max_abs_error': max_error,
+        'mismatches': sum(1 for error in errors if error > args.tolerance),
+        'worst_headline': headlines[worst] if worst is not None and max_error > 0 else None,
+        'within_tolerance': max_error <= args.tolerance
+    }
+
+    print(
+        f"✅ TextBlob {results['textblob']['headlines_per_second']}/s, "
+        f"lexicon {results['lexicon']['headlines_per_second']}/s ({results['speedup']}x)"
+    )
+    if results['within_tolerance']:
+        print(f"✅ Max polarity difference {max_error:.2e} (tolerance {args.tolerance:.0e})")
+    else:
+        print(f"❌ {results['mismatches']} headlines differ by more than {args.tolerance:.0e} (max {max_error:.4f})")
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+        print(f"✅ Results written to {args.output}")
+    else:
+        print(output)
+
+    sys.exit(0 if results['within_tolerance'] else 1)
+
+if __name__ == '__main__':
+    main()
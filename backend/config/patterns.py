@@ -0,0 +1,98 @@
+import json
+from .settings import PATTERNS_FILE
+
+# Default substring patterns used by the scrapers and the fact checker.
+# Each set maps category -> patterns; the file at PATTERNS_FILE (JSON, same shape)
+# can add more patterns to any set or category.
+DEFAULT_PATTERN_SETS = {
+    # Text that marks page chrome rather than a headline
+    'headline_filters': {
+        'invalid': [
+            'cookie', 'privacy policy', 'terms of service',
+            'subscribe', 'newsletter', 'advertisement',
+            'click here', 'read more', 'continue reading',
+            'sign up', 'log in', 'follow us', 'share this',
+            'comments', 'related articles'
+        ]
+    },
+    'quick_headline_filters': {
+        'invalid': ['cookie', 'privacy', 'subscribe', 'newsletter', 'click here']
+    },
+    # URL fragments that indicate non-article pages
+    'article_url_filters': {
+        'invalid': [
+            '/tag/', '/category/', '/author/', '/search/',
+            '/page/', '/feed/', '/rss/', '/sitemap/',
+            '/contact', '/about', '/privacy', '/terms'
+        ]
+    },
+    'image_url_hints': {
+        'extension': ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg'],
+        'image_domain': ['cdn.', 'images.', 'img.', 'static.']
+    },
+    # Rule-based fallback used when the fake news model is not loaded
+    'rule_based_indicators': {
+        'credible': [
+            'according to study', 'research shows', 'data indicates',
+            'experts say', 'official statement', 'peer-reviewed',
+            'reuters reports', 'ap news', 'government data'
+        ],
+        'fake': [
+            'secret cure', 'doctors hate this', 'miracle breakthrough',
+            'government cover-up', 'they don\'t want you to know',
+            'shocking truth', 'one weird trick', 'big pharma conspiracy'
+        ]
+    },
+    'fact_check_keywords': {
+        'high_credible': [
+            'peer-reviewed study', 'published research', 'clinical trial',
+            'government data', 'official statistics'
+        ],
+        'high_fake': [
+            'secret government', 'big pharma conspiracy', 'miracle cure',
+            'doctors hate this', 'they don\'t want you to know'
+        ],
+        'medium_credible': ['study shows', 'research indicates', 'experts say'],
+        'medium_fake': ['shocking truth', 'unbelievable', 'you won\'t believe']
+    },
+    'fact_check_language': {
+        'professional': [
+            'according to', 'data shows', 'research indicates',
+            'officials say', 'spokesperson stated'
+        ],
+        'sensational': [
+            'absolutely incredible', 'mind-blowing', 'shocking',
+            'unbelievable', 'amazing discovery'
+        ]
+    },
+    'source_domains': {
+        'tier1': ['reuters.com', 'bbc.com', 'cnn.com', 'npr.org'],
+        'tier2': ['apnews.com', 'washingtonpost.com', 'nytimes.com', 'theguardian.com', 'wsj.com'],
+        'questionable': ['infowars.com', 'naturalnews.com', 'beforeitsnews.com']
+    }
+}
+
+def load_pattern_sets(path=PATTERNS_FILE):
+    """Default pattern sets extended with the patterns from a JSON file, if configured"""
+    pattern_sets = {
+        name: {category: list(patterns) for category, patterns in categories.items()}
+        for name, categories in DEFAULT_PATTERN_SETS.items()
+    }
+
+    if not path:
+        return pattern_sets
+
+    try:
+        with open(path, 'r') as f:
+            extra_sets = json.load(f)
+    except Exception as e:
+        print(f"❌ Could not load patterns from {path}: {e} - using defaults")
+        return pattern_sets
+
+    for name, categories in extra_sets.items():
+        for category, patterns in categories.items():
+            pattern_sets.setdefault(name, {}).setdefault(category, []).extend(patterns)
+
+    return pattern_sets
+
+PATTERN_SETS = load_pattern_sets()
@@ -40,11 +40,85 @@ NEWS_SOURCES = {
     ]
 }
 
+# Local cache directory (HTTP validators, image metadata, seen articles)
+CACHE_DIR = os.getenv('CACHE_DIR', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache'))
+
+# Article image cache
+IMAGE_CACHE_TTL = int(os.getenv('IMAGE_CACHE_TTL', 7 * 24 * 3600))  # Seconds to keep a found image
+IMAGE_CACHE_NEGATIVE_TTL = int(os.getenv('IMAGE_CACHE_NEGATIVE_TTL', 6 * 3600))  # Seconds to remember "no image"
+IMAGE_CACHE_MAX_ENTRIES = int(os.getenv('IMAGE_CACHE_MAX_ENTRIES', 20000))
+
+# Seen-article index for incremental crawls
+SEEN_INDEX_CAPACITY = int(os.getenv('SEEN_INDEX_CAPACITY', 200000))  # Bloom filter sizing
+SEEN_INDEX_FALSE_POSITIVE_RATE = 0.01
+SEEN_INDEX_TTL = int(os.getenv('SEEN_INDEX_TTL', 14 * 24 * 3600))  # Forget articles unseen this long
+
+# Cross-source near-duplicate detection (MinHash-LSH over headline word shingles)
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv('NEAR_DUPLICATE_THRESHOLD', 0.8))  # Exact Jaccard similarity of headline shingles
+NEAR_DUPLICATE_CONTAINMENT = float(os.getenv('NEAR_DUPLICATE_CONTAINMENT', 0.9))  # Share of the shorter headline's shingles found in the longer one
+
+# Stream article pages and stop at </head> once og:image/twitter:image is known
+STREAM_IMAGE_EXTRACTION = os.getenv('STREAM_IMAGE_EXTRACTION', 'true').lower() == 'true'
+MAX_HEAD_BYTES = 256 * 1024  # Give up on head-only scanning past this many bytes
+
+# Optional JSON file with extra filter/scoring patterns (see config/patterns.py)
+PATTERNS_FILE = os.getenv('PATTERNS_FILE')
+
+# HTTP record/replay archive for offline benchmarking ('record', 'replay' or empty to disable)
+HTTP_ARCHIVE_MODE = os.getenv('HTTP_ARCHIVE_MODE', '').lower()
+HTTP_ARCHIVE_PATH = os.getenv('HTTP_ARCHIVE_PATH', '')  # e.g. bench/crawl.har.jsonl.gz
+HTTP_REPLAY_LATENCY = os.getenv('HTTP_REPLAY_LATENCY', '0')  # Seconds per replayed request, or 'recorded'
+
+# Live feed snapshot cache (stale-while-revalidate)
+LIVE_FEED_TTL = int(os.getenv('LIVE_FEED_TTL', 60))  # Seconds a snapshot counts as fresh
+LIVE_FEED_MAX_STALE = int(os.getenv('LIVE_FEED_MAX_STALE', 15 * 60))  # Older snapshots are refetched before answering
+LIVE_FEED_DEADLINE = float(os.getenv('LIVE_FEED_DEADLINE', 10))  # Seconds to wait for sources; later ones finish in the background
+LIVE_FEED_WORKERS = int(os.getenv('LIVE_FEED_WORKERS', 4))
+LIVE_FEED_INCREMENTAL_SYNC = os.getenv('LIVE_FEED_INCREMENTAL_SYNC', 'true').lower() == 'true'  # Diff live_feed_headlines instead of rewriting it
+
+# Background live feed poller (ring buffer behind /api/live-feed?since=<cursor>)
+LIVE_POLLER_ENABLED = os.getenv('LIVE_POLLER_ENABLED', 'true').lower() == 'true'
+LIVE_POLL_INTERVAL = int(os.getenv('LIVE_POLL_INTERVAL', 60))  # Seconds between polls of a source with news
+LIVE_POLL_MAX_INTERVAL = int(os.getenv('LIVE_POLL_MAX_INTERVAL', 600))  # Back-off ceiling for quiet sources
+LIVE_POLL_WORKERS = int(os.getenv('LIVE_POLL_WORKERS', 4))
+LIVE_BUFFER_SIZE = int(os.getenv('LIVE_BUFFER_SIZE', 500))  # Items kept for cursor readers
+SSE_HEARTBEAT_SECONDS = int(os.getenv('SSE_HEARTBEAT_SECONDS', 15))  # Comment line sent to idle streams
+SSE_QUEUE_SIZE = int(os.getenv('SSE_QUEUE_SIZE', 100))  # Unsent events per stream before it is dropped
+
+# Sentiment analysis: results memoized by normalized headline (LRU entries) and scoring backend
+SENTIMENT_MEMO_SIZE = int(os.getenv('SENTIMENT_MEMO_SIZE', 10000))
+SENTIMENT_BACKEND = os.getenv('SENTIMENT_BACKEND', 'textblob').lower()  # 'lexicon' = NumPy batch scoring with TextBlob's lexicon
+
 # Scraping Configuration
-# Scraping Configuration - REDUCED DELAYS
-SCRAPING_DELAY_MIN = 0.1  # Reduced from 1 second
-SCRAPING_DELAY_MAX = 0.2  # Reduced from 3 seconds
 SCRAPING_TIMEOUT = 15
 MAX_HEADLINES_PER_SOURCE = 1
 MAX_HEADLINES_PER_CATEGORY = 30
 
+# Crawl Pipeline Configuration (fetch -> parse -> enrich -> analyze -> store)
+CRAWL_CONCURRENCY = int(os.getenv('CRAWL_CONCURRENCY', 8))  # Default worker count for the network stages
+CRAWL_FETCH_WORKERS = int(os.getenv('CRAWL_FETCH_WORKERS', CRAWL_CONCURRENCY))
+CRAWL_PARSE_WORKERS = int(os.getenv('CRAWL_PARSE_WORKERS', os.cpu_count() or 1))
+CRAWL_ENRICH_WORKERS = int(os.getenv('CRAWL_ENRICH_WORKERS', CRAWL_CONCURRENCY))
+CRAWL_STORE_WORKERS = int(os.getenv('CRAWL_STORE_WORKERS', 2))
+CRAWL_QUEUE_SIZE = int(os.getenv('CRAWL_QUEUE_SIZE', 32))  # Bounded queue in front of each stage
+CRAWL_PROCESS_WORKERS = int(os.getenv('CRAWL_PROCESS_WORKERS', 0))  # Warm CPU worker processes (e.g. os.cpu_count()); 0 = parse/analyze in threads
+CPU_CHUNK_SIZE = int(os.getenv('CPU_CHUNK_SIZE', 256))  # Most headlines sent to a worker per task
+CPU_MIN_CHUNK_SIZE = int(os.getenv('CPU_MIN_CHUNK_SIZE', 32))  # Smaller batches are scored inline
+
+# Per-host Request Scheduler (replaces fixed random delays)
+HOST_REQUEST_RATE = float(os.getenv('HOST_REQUEST_RATE', 2.0))  # Requests/sec per host when healthy
+HOST_REQUEST_BURST = int(os.getenv('HOST_REQUEST_BURST', 2))
+HOST_MAX_CONCURRENCY = int(os.getenv('HOST_MAX_CONCURRENCY', 2))
+HOST_MIN_REQUEST_RATE = 0.1  # Floor for backoff after 403/429 or slow responses
+HOST_SLOW_RESPONSE_SECONDS = 5.0
+
+# Per-source circuit breaker (quarantines sources that keep failing)
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', 3))  # Consecutive failures before opening
+CIRCUIT_BASE_COOLDOWN = int(os.getenv('CIRCUIT_BASE_COOLDOWN', 300))  # Seconds; doubles after each failed probe
+CIRCUIT_MAX_COOLDOWN = int(os.getenv('CIRCUIT_MAX_COOLDOWN', 6 * 3600))
+
+# Shared HTTP client (connection pools and DNS cache for all outbound requests)
+HTTP_POOL_HOSTS = int(os.getenv('HTTP_POOL_HOSTS', 64))  # Hosts with a pool kept open
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', max(CRAWL_CONCURRENCY, HOST_MAX_CONCURRENCY)))  # Connections per host
+DNS_CACHE_TTL = int(os.getenv('DNS_CACHE_TTL', 300))  # Seconds; 0 disables the DNS cache
+
@@ -1,13 +1,22 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 from datetime import datetime
 import json
-from config.settings import NEWS_SOURCES
+import time
+from config.settings import NEWS_SOURCES, LIVE_POLLER_ENABLED
 from services.global_database import global_db
 from services.supabase_client import supabase_db
 from services.news_processor import NewsProcessingService
+from services.sentiment_analyzer import sentiment_analyzer
 from services.live_feed_service import live_feed_service
+from services.live_feed_poller import live_feed_poller
 from services.chatbot_service import production_chatbot_service
 from services.fake_news_analyzer import fake_news_analyzer
+from utils.http_client import http_client
+from utils.request_scheduler import request_scheduler
+from utils.circuit_breaker import source_breaker
+from utils.single_flight import single_flight
+from utils.worker_pool import cpu_pool
+from utils.seen_index import seen_index
 
 # Create Blueprint
 api_bp = Blueprint('api', __name__, url_prefix='/api')
@@ -15,6 +24,13 @@ api_bp = Blueprint('api', __name__, url_prefix='/api')
 # Initialize services
 news_service = NewsProcessingService()
 
+def _with_alternate_sources(headlines):
+    """Add the other sources the crawl found for each headline's story (kept in the seen index)"""
+    return [
+        dict(headline, alternate_sources=seen_index.alternate_sources(headline.get('source_url', ''), headline.get('headline', '')))
+        for headline in headlines
+    ]
+
 
 
 
@@ -55,7 +71,7 @@ def get_headlines(category, sentiment):
         images_only = request.args.get('images_only', default=False, type=bool)
         
         # Fetch from Redis (now includes image URLs)
-        headlines = supabase_db.get_headlines(category, sentiment, limit)
+        headlines = _with_alternate_sources(supabase_db.get_headlines(category, sentiment, limit))
         
         # Apply filters
         filtered_headlines = []
@@ -98,7 +114,8 @@ def trigger_crawl():
         return jsonify({
             'message': 'Enhanced news crawl completed successfully',
             'headlines_processed': total_processed,
-            'image_stats': image_stats
+            'image_stats': image_stats,
+            'pipeline_stats': news_service.crawl_engine.get_stats()
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -121,6 +138,48 @@ def get_image_stats():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@api_bp.route('/http-stats', methods=['GET'])
+def get_http_stats():
+    """Connection reuse, DNS cache and per-host scheduling figures for outbound HTTP"""
+    try:
+        return jsonify({
+            'http_client': http_client.get_stats(),
+            'scheduler': request_scheduler.get_stats()
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api_bp.route('/source-health', methods=['GET'])
+def get_source_health():
+    """Circuit breaker state and failure counters per news source"""
+    try:
+        sources = source_breaker.get_stats()
+        return jsonify({
+            'sources': sources,
+            'open': sorted(source for source, state in sources.items() if state['state'] != 'closed')
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api_bp.route('/coalescing-stats', methods=['GET'])
+def get_coalescing_stats():
+    """How many live feed, bulk download and crawl requests shared an in-flight computation"""
+    try:
+        return jsonify({'single_flight': single_flight.get_stats()})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api_bp.route('/sentiment-stats', methods=['GET'])
+def get_sentiment_stats():
+    """Hit/miss counters of the memoized sentiment analyzer and the CPU worker pool"""
+    try:
+        return jsonify({
+            'sentiment_cache': sentiment_analyzer.get_stats(),
+            'cpu_pool': cpu_pool.get_stats()
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @api_bp.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -140,11 +199,18 @@ def health_check():
 
 @api_bp.route('/live-feed', methods=['GET'])
 def get_live_feed():
-    """Get live feed headlines for immediate display"""
+    """Get live feed headlines for immediate display (?since=<cursor> returns only newer items)"""
     try:
-        force_refresh = request.args.get('refresh', default=False, type=bool)
+        if 'since' in request.args:
+            return _get_live_feed_delta()
+        
+        force_refresh = request.args.get('refresh', '').lower() in ('1', 'true', 'yes')
         
-        result = live_feed_service.get_live_feed(force_refresh=force_refresh)
+        # Optional latency budget: answer with the sources done by then, the rest keep loading
+        deadline_ms = request.args.get('deadline_ms', default=None, type=int)
+        deadline = deadline_ms / 1000 if deadline_ms is not None else None
+        
+        result = live_feed_service.get_live_feed(force_refresh=force_refresh, deadline=deadline)
         
         if result['success']:
             data = result['data']
@@ -153,6 +219,10 @@ def get_live_feed():
                 'total': data.get('total', 0),
                 'timestamp': data.get('timestamp'),
                 'from_cache': result.get('from_cache', False),
+                'age_seconds': result.get('age_seconds', 0),
+                'stale': result.get('stale', False),
+                'pending_sources': data.get('pending', []),
+                'skipped_sources': data.get('skipped', []),
                 'status': 'success'
             })
         else:
@@ -171,6 +241,39 @@ def get_live_feed():
             'status': 'error'
         }), 500
 
+def _get_live_feed_delta():
+    """Items the background poller buffered after the client's cursor; never scrapes"""
+    if LIVE_POLLER_ENABLED:
+        live_feed_poller.start()
+    
+    cursor = request.args.get('since', default=0, type=int)
+    limit = request.args.get('limit', default=None, type=int)
+    headlines, next_cursor, missed = live_feed_poller.since(cursor, limit)
+    
+    return jsonify({
+        'headlines': headlines,
+        'total': len(headlines),
+        'cursor': next_cursor,
+        'missed': missed,  # Cursor fell out of the buffer: refetch the full feed
+        'timestamp': time.time(),
+        'status': 'success'
+    })
+
+@api_bp.route('/live-feed/stream', methods=['GET'])
+def stream_live_feed():
+    """Server-Sent Events stream of new live headlines (resumes from Last-Event-ID)"""
+    if LIVE_POLLER_ENABLED:
+        live_feed_poller.start()
+    
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id', '')
+    cursor = int(last_event_id) if last_event_id.isdigit() else None
+    
+    return Response(
+        live_feed_poller.stream(cursor),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @api_bp.route('/live-feed/refresh', methods=['POST'])
 def refresh_live_feed():
     """Manually refresh live feed"""
@@ -194,6 +297,7 @@ def get_live_feed_status():
     """Get live feed status"""
     try:
         status = live_feed_service.get_status()
+        status['poller'] = live_feed_poller.get_status()
         return jsonify(status)
     except Exception as e:
         return jsonify({
@@ -315,8 +419,8 @@ def download_bulk_update(update_id):
             print("❌ No update_id available")
             return jsonify({'error': 'No updates available'}), 404
         
-        # Get headlines using your existing supabase client
-        headlines = supabase_db.get_bulk_data_for_sync(update_id)
+        # Get headlines using your existing supabase client; simultaneous syncs share one query
+        headlines = single_flight.do(f'bulk_download:{update_id}', supabase_db.get_bulk_data_for_sync, update_id)
         
         print(f"📊 Retrieved {len(headlines)} headlines from database")
         
@@ -345,6 +449,7 @@ def download_bulk_update(update_id):
                 'totalCount': 0
             }), 404
         
+        headlines = _with_alternate_sources(headlines)
         response_data = {
             'updateId': update_id,
             'headlines': headlines,
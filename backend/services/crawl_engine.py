@@ -0,0 +1,175 @@
+import threading
+from config.settings import (
+    MAX_HEADLINES_PER_SOURCE, CRAWL_FETCH_WORKERS, CRAWL_PARSE_WORKERS, CRAWL_ENRICH_WORKERS,
+    CRAWL_STORE_WORKERS, CRAWL_QUEUE_SIZE
+)
+from utils.staged_pipeline import PipelineStage, StagedPipeline
+from utils.worker_pool import cpu_pool
+from utils.seen_index import seen_index
+from utils.near_duplicates import StoryDeduplicator, source_rank, source_entry
+from .news_scraper import NewsScraperService
+from .sentiment_analyzer import sentiment_analyzer
+from .supabase_client import supabase_db
+
+# Per-process scraper used by parse workers (built by the pool's warm-up)
+_worker_scraper = None
+
+def _warm_parser():
+    """Build the worker's scraper (selector engine, pattern matchers) before its first page"""
+    global _worker_scraper
+    if _worker_scraper is None:
+        _worker_scraper = NewsScraperService()
+
+def _parse_in_worker(url, category, content):
+    """Parse a source page inside a worker process"""
+    _warm_parser()
+    return _worker_scraper.parse_source_page(url, category, content)
+
+cpu_pool.add_warmer(_warm_parser)
+
+class CrawlPipeline:
+    """Bounded staged crawl: fetch -> parse -> enrich -> analyze -> store.
+
+    I/O stages (fetch, enrich, store) run in threads; the CPU-bound parse and
+    analyze stages hand their work to the warm worker pool when CRAWL_PROCESS_WORKERS > 0.
+    Analyze is a batch stage: one memoized analyze_batch call per crawl, scored in chunks.
+    """
+
+    def __init__(self, scraper, analyzer=sentiment_analyzer, pool=cpu_pool):
+        self.scraper = scraper
+        self.analyzer = analyzer
+        self.pool = pool
+        self.lock = threading.Lock()  # One crawl at a time per pipeline (shared queues)
+        self.stories = StoryDeduplicator()
+        self.pipeline = StagedPipeline([
+            PipelineStage('fetch', self._fetch, CRAWL_FETCH_WORKERS, CRAWL_QUEUE_SIZE),
+            PipelineStage('parse', self._parse, CRAWL_PARSE_WORKERS, CRAWL_QUEUE_SIZE),
+            PipelineStage('enrich', self._enrich, CRAWL_ENRICH_WORKERS, CRAWL_QUEUE_SIZE),
+            PipelineStage('analyze', self._analyze, 1, CRAWL_QUEUE_SIZE, batch=True),
+            PipelineStage('store', self._store, CRAWL_STORE_WORKERS, CRAWL_QUEUE_SIZE)
+        ])
+
+    def crawl(self, sources):
+        """Crawl {category: [source_url, ...]}; returns (news items in source order, number of new items)"""
+        pairs = [(category, source) for category, urls in sources.items() for source in urls]
+        jobs = [
+            {'order': (index,), 'category': category, 'source': source}
+            for index, (category, source) in enumerate(pairs)
+        ]
+
+        with self.lock:
+            self.stories = StoryDeduplicator()
+            results = self.pipeline.run(jobs)
+
+        # A better-sourced version may have arrived after an item was already stored
+        results = [item for item in results if self.stories.is_best(item['order'])]
+        for item in results:
+            self._attach_alternates(item)
+
+        results.sort(key=lambda item: item['order'])
+        new_count = sum(1 for item in results if item['is_new'])
+        return [item['news_item'] for item in results], new_count
+
+    def get_stats(self):
+        """Per-stage throughput and queue-depth counters of the last crawl"""
+        stats = self.pipeline.get_stats()
+        stats['near_duplicates'] = self.stories.duplicates
+        stats['sentiment_cache'] = self.analyzer.get_stats()
+        stats['cpu_pool'] = self.pool.get_stats()
+        return stats
+
+    def _fetch(self, job):
+        """Fetch stage: conditional GET of the source page"""
+        job['page'] = self.scraper.fetch_source_page(job['source'], job['category'])
+        return [job]
+
+    def _parse(self, job):
+        """Parse stage: extract headlines, one pipeline item per headline"""
+        page = job['page']
+        headlines = page.headlines
+        if headlines is None:
+            headlines = self.pool.run(_parse_in_worker, page.url, page.category, page.content)
+            self.scraper.remember_parsed(page, headlines)
+
+        return [
+            {'order': job['order'] + (position,), 'category': job['category'], 'headline_data': headline_data}
+            for position, headline_data in enumerate(headlines[:MAX_HEADLINES_PER_SOURCE])
+        ]
+
+    def _enrich(self, item):
+        """Enrich stage: drop cross-source duplicates, reuse known articles, otherwise look up the article image"""
+        headline_data = item['headline_data']
+
+        rank = (source_rank(headline_data['source_url']), item['order'])
+        if not self.stories.offer(item['order'], headline_data['headline'], source_entry(headline_data['source_url']), rank):
+            return []  # Same story as a better-sourced headline in this crawl
+
+        known_item = seen_index.get(headline_data['source_url'], headline_data['headline'])
+
+        if known_item:
+            # Known article: reuse its stored sentiment and image, skip the write
+            item['news_item'] = dict(known_item, category=item['category'])
+            if known_item.get('image_url') is None:
+                # Its image lookup failed last time: try again
+                self.scraper.attach_image(headline_data)
+                item['news_item']['image_url'] = headline_data['image_url']
+                item['image_retry'] = True
+        else:
+            self.scraper.attach_image(headline_data)
+        return [item]
+
+    def _analyze(self, items):
+        """Analyze stage: sentiment for all new headlines of the crawl in one batch"""
+        new_items = [item for item in items if 'news_item' not in item]
+        sentiment_results = self.analyzer.analyze_batch([item['headline_data']['headline'] for item in new_items])
+
+        for item, sentiment_result in zip(new_items, sentiment_results):
+            headline_data = item['headline_data']
+
+            # Combine data for global storage
+            item['news_item'] = {
+                'headline': headline_data['headline'],
+                'category': item['category'],
+                'sentiment': sentiment_result['sentiment'],
+                'confidence': sentiment_result['confidence'],
+                'source_url': headline_data.get('source_url', ''),
+                'image_url': headline_data.get('image_url', '')
+            }
+            item['is_new'] = True
+        return items
+
+    def _store(self, item):
+        """Store stage: write new headlines and remember them for later crawls"""
+        if not self.stories.is_best(item['order']):
+            return []  # Superseded by a better-sourced version of the story
+
+        if item.get('is_new'):
+            # Only remember what was written, so a failed write is retried next crawl
+            if supabase_db.store_headline(item['news_item']):
+                self._remember(item)
+        else:
+            item['is_new'] = False
+            if item.get('image_retry'):
+                self._remember(item)
+        return [item]
+
+    def _remember(self, item):
+        """Add a headline to the seen index; a failed image lookup is kept as unknown (None)
+        so a later crawl looks it up again instead of reusing the empty image"""
+        news_item = item['news_item']
+        if item['headline_data'].get('image_failed'):
+            news_item = dict(news_item, image_url=None)
+        seen_index.add(news_item)
+        item['remembered'] = True
+
+    def _attach_alternates(self, item):
+        """Record the story's other sources on the kept headline and, for articles in the
+        seen index, with its stored copy, where later crawls and the API read them"""
+        news_item = item['news_item']
+        stored = news_item.get('alternate_sources')
+        alternates = self.stories.alternates(item['order']) or stored or []
+        news_item['alternate_sources'] = alternates
+
+        # A new headline whose write failed is not indexed; it is stored again next crawl
+        if alternates != stored and (item.get('remembered') or not item.get('is_new')):
+            self._remember(item)
@@ -6,11 +6,22 @@ from datetime import datetime
 import json
 import os
 import logging
+from config.patterns import PATTERN_SETS
+from utils.pattern_matcher import PatternMatcher
+from utils.http_client import http_client
+from utils.request_scheduler import request_scheduler
+from utils.feed_parser import parse_feed
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Scoring patterns, compiled once at import
+rule_based_indicators = PatternMatcher(PATTERN_SETS['rule_based_indicators'])
+fact_check_keywords = PatternMatcher(PATTERN_SETS['fact_check_keywords'])
+fact_check_language = PatternMatcher(PATTERN_SETS['fact_check_language'])
+source_domains = PatternMatcher(PATTERN_SETS['source_domains'])
+
 class ProductionFakeNewsAnalyzer:
     """Production-ready fake news analyzer with trained model"""
     
@@ -178,24 +189,10 @@ class ProductionFakeNewsAnalyzer:
     
     def _rule_based_analysis(self, text):
         """Fallback rule-based analysis"""
-        text_lower = text.lower()
-        
-        # Credibility indicators
-        credible_patterns = [
-            'according to study', 'research shows', 'data indicates',
-            'experts say', 'official statement', 'peer-reviewed',
-            'reuters reports', 'ap news', 'government data'
-        ]
-        
-        # Misinformation indicators
-        fake_patterns = [
-            'secret cure', 'doctors hate this', 'miracle breakthrough',
-            'government cover-up', 'they don\'t want you to know',
-            'shocking truth', 'one weird trick', 'big pharma conspiracy'
-        ]
-        
-        credible_count = sum(1 for pattern in credible_patterns if pattern in text_lower)
-        fake_count = sum(1 for pattern in fake_patterns if pattern in text_lower)
+        # Credibility and misinformation indicators, counted in one pass
+        counts = rule_based_indicators.count(text)
+        credible_count = counts.get('credible', 0)
+        fake_count = counts.get('fake', 0)
         
         if fake_count > credible_count:
             prediction = 'FAKE'
@@ -280,26 +277,21 @@ class EnhancedFactChecker:
     """Enhanced fact-checking service for production use"""
     
     def __init__(self):
-        self.credible_domains = [
-            'reuters.com', 'bbc.com', 'cnn.com', 'npr.org', 'apnews.com',
-            'washingtonpost.com', 'nytimes.com', 'theguardian.com', 'wsj.com'
-        ]
-        
-        self.questionable_domains = [
-            'infowars.com', 'naturalnews.com', 'beforeitsnews.com'
-        ]
+        # Domain tiers live in the 'source_domains' pattern set
+        self.source_domains = source_domains
+        self.session = http_client.session()
+    
     def simple_headline_check(self, user_text):
         """Simple real-time headline check - just 10 lines of code"""
-        import requests
-        import feedparser
-        
         # Extract 2-3 key words from user input
         key_words = [word for word in user_text.lower().split() if len(word) > 4][:3]
         
         # Check just one reliable RSS feed (Reuters)
         try:
-            feed = feedparser.parse('https://feeds.reuters.com/reuters/topNews')
-            recent_headlines = [entry.title.lower() for entry in feed.entries[:20]]
+            # Pooled, scheduled fetch instead of feedparser opening its own connection
+            response = request_scheduler.get(self.session, 'https://feeds.reuters.com/reuters/topNews', timeout=5)
+            response.raise_for_status()
+            recent_headlines = [item['title'].lower() for item in parse_feed(response.content, 20)]
             
             # Simple matching: if any key word appears in recent headlines
             matches = sum(1 for headline in recent_headlines 
@@ -345,41 +337,13 @@ class EnhancedFactChecker:
     
     def _analyze_keywords(self, text):
         """Analyze keywords for credibility indicators"""
-        text_lower = text.lower()
-        
-        # High credibility patterns
-        high_credible = [
-            'peer-reviewed study', 'published research', 'clinical trial',
-            'government data', 'official statistics'
-        ]
-        
-        # High misinformation patterns
-        high_fake = [
-            'secret government', 'big pharma conspiracy', 'miracle cure',
-            'doctors hate this', 'they don\'t want you to know'
-        ]
-        
-        # Medium patterns
-        medium_credible = ['study shows', 'research indicates', 'experts say']
-        medium_fake = ['shocking truth', 'unbelievable', 'you won\'t believe']
+        counts = fact_check_keywords.count(text)
         
         score = 50  # Start neutral
-        
-        for pattern in high_credible:
-            if pattern in text_lower:
-                score += 25
-        
-        for pattern in high_fake:
-            if pattern in text_lower:
-                score -= 25
-        
-        for pattern in medium_credible:
-            if pattern in text_lower:
-                score += 15
-        
-        for pattern in medium_fake:
-            if pattern in text_lower:
-                score -= 15
+        score += 25 * counts.get('high_credible', 0)
+        score -= 25 * counts.get('high_fake', 0)
+        score += 15 * counts.get('medium_credible', 0)
+        score -= 15 * counts.get('medium_fake', 0)
         
         return max(0, min(100, score))
     
@@ -388,38 +352,27 @@ class EnhancedFactChecker:
         if not source_url:
             return 40
         
-        url_lower = source_url.lower()
+        tiers = self.source_domains.find(source_url)
         
         # Tier 1: Highly credible
-        if any(domain in url_lower for domain in self.credible_domains[:4]):
+        if 'tier1' in tiers:
             return 90
         
         # Tier 2: Generally credible
-        if any(domain in url_lower for domain in self.credible_domains[4:]):
+        if 'tier2' in tiers:
             return 75
         
         # Known questionable sources
-        if any(domain in url_lower for domain in self.questionable_domains):
+        if 'questionable' in tiers:
             return 15
         
         return 45  # Unknown source
     
     def _analyze_language_patterns(self, text):
         """Analyze language patterns"""
-        text_lower = text.lower()
-        
-        professional_patterns = [
-            'according to', 'data shows', 'research indicates',
-            'officials say', 'spokesperson stated'
-        ]
-        
-        sensational_patterns = [
-            'absolutely incredible', 'mind-blowing', 'shocking',
-            'unbelievable', 'amazing discovery'
-        ]
-        
-        professional_count = sum(1 for p in professional_patterns if p in text_lower)
-        sensational_count = sum(1 for p in sensational_patterns if p in text_lower)
+        counts = fact_check_language.count(text)
+        professional_count = counts.get('professional', 0)
+        sensational_count = counts.get('sensational', 0)
         
         if professional_count > sensational_count:
             return 75
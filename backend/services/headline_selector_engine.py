@@ -0,0 +1,173 @@
+import re
+import lxml.html
+from lxml import etree
+
+# Enhanced selectors that target clickable headline elements, in priority order
+HEADLINE_SELECTORS = [
+    'a h1', 'a h2', 'a h3',  # Headlines inside links
+    'h1 a', 'h2 a', 'h3 a',  # Links inside headlines
+    'a[href*="article"]', 'a[href*="story"]', 'a[href*="news"]',
+    '.headline a', '.title a', '.story-title a',
+    '.entry-title a', '.post-title a',
+    '.story-headline a', '.news-title a',
+    'article a', '.article-link'
+]
+
+# Text inside these elements is not visible headline text
+NON_TEXT_TAGS = ('script', 'style', 'template')
+
+_SIMPLE_SELECTOR = re.compile(r'^(?:(?P<tag>[a-z0-9]+)|\.(?P<cls>[\w-]+))(?:\[href\*="(?P<href>[^"]+)"\])?$')
+
+class CompiledSelector:
+    """A selector of the form '[ancestor ]target' reduced to plain comparisons"""
+
+    def __init__(self, selector):
+        parts = selector.split()
+        if len(parts) > 2:
+            raise ValueError(f"Unsupported headline selector: {selector}")
+
+        target = _SIMPLE_SELECTOR.match(parts[-1])
+        ancestor = _SIMPLE_SELECTOR.match(parts[0]) if len(parts) == 2 else None
+        if not target or (len(parts) == 2 and (not ancestor or ancestor.group('href'))):
+            raise ValueError(f"Unsupported headline selector: {selector}")
+
+        self.selector = selector
+        self.tag = target.group('tag')
+        self.cls = target.group('cls')
+        self.href_contains = target.group('href')
+        self.ancestor_tag = ancestor.group('tag') if ancestor else None
+        self.ancestor_cls = ancestor.group('cls') if ancestor else None
+
+    def matches(self, element, classes, open_tags, open_classes):
+        """Check the element against this selector given the currently open ancestors"""
+        if self.tag and element.tag != self.tag:
+            return False
+        if self.cls and self.cls not in classes:
+            return False
+        if self.href_contains and self.href_contains not in element.get('href', ''):
+            return False
+        if self.ancestor_tag and not open_tags.get(self.ancestor_tag):
+            return False
+        if self.ancestor_cls and not open_classes.get(self.ancestor_cls):
+            return False
+        return True
+
+class HeadlineSelectorEngine:
+    """Single-pass headline extraction: parse with lxml, walk the tree once and
+    match every headline selector per element, keeping selector priority order"""
+
+    def __init__(self, selectors=HEADLINE_SELECTORS):
+        self.selectors = [CompiledSelector(selector) for selector in selectors]
+
+        # Only these ancestors ever matter, so only these are tracked during the walk
+        self.tracked_tags = {s.ancestor_tag for s in self.selectors if s.ancestor_tag}
+        self.tracked_classes = {s.ancestor_cls for s in self.selectors if s.ancestor_cls}
+
+        # Selectors indexed by the target tag they need (None = any tag, class-based)
+        self.by_tag = {}
+        for index, selector in enumerate(self.selectors):
+            self.by_tag.setdefault(selector.tag, []).append(index)
+
+    def extract(self, content, accept, limit):
+        """Return up to limit accepted (headline, url) pairs, best selector first.
+
+        accept(headline_text, href) returns the pair to keep, or None to reject it.
+        """
+        try:
+            root = lxml.html.fromstring(content)
+        except (etree.ParserError, ValueError):
+            return []
+
+        buckets = [[] for _ in self.selectors]
+        top_priority_texts = set()
+        open_tags = {}
+        open_classes = {}
+        stack = []
+
+        for event, element in etree.iterwalk(root, events=('start', 'end')):
+            if not isinstance(element.tag, str):
+                continue  # Comments and processing instructions
+
+            if event == 'end':
+                tag, classes = stack.pop()
+                if tag:
+                    open_tags[tag] -= 1
+                for cls in classes:
+                    open_classes[cls] -= 1
+                continue
+
+            classes = element.get('class', '').split()
+            candidates = self.by_tag.get(element.tag, []) + (self.by_tag.get(None, []) if classes else [])
+
+            pair = None
+            for index in sorted(candidates):
+                if not self.selectors[index].matches(element, classes, open_tags, open_classes):
+                    continue
+
+                # The element's text and link are the same for every selector it matches
+                if pair is None:
+                    pair = self._headline_pair(element, accept) or False
+                if pair:
+                    buckets[index].append(pair)
+                    if index == 0:
+                        top_priority_texts.add(pair[0])
+
+            tracked_tag = element.tag if element.tag in self.tracked_tags else None
+            tracked_classes = [cls for cls in classes if cls in self.tracked_classes]
+            if tracked_tag:
+                open_tags[tracked_tag] = open_tags.get(tracked_tag, 0) + 1
+            for cls in tracked_classes:
+                open_classes[cls] = open_classes.get(cls, 0) + 1
+            stack.append((tracked_tag, tracked_classes))
+
+            # Nothing found later can outrank a full set from the top-priority selector
+            if len(top_priority_texts) >= limit:
+                break
+
+        return self._merge(buckets, limit)
+
+    def _headline_pair(self, element, accept):
+        """Headline text and link for a matched element, filtered through accept()"""
+        if element.tag == 'a':
+            link = element
+        else:
+            # Element contains a link
+            link = next(element.iter('a'), None)
+            if link is None:
+                return None
+
+        return accept(element_text(element), link.get('href'))
+
+    def _merge(self, buckets, limit):
+        """Concatenate buckets in priority order, dropping repeated headlines"""
+        results = []
+        seen_headlines = set()
+
+        for bucket in buckets:
+            for headline_text, article_url in bucket:
+                if headline_text in seen_headlines:
+                    continue
+
+                seen_headlines.add(headline_text)
+                results.append((headline_text, article_url))
+
+                if len(results) >= limit:
+                    return results
+
+        return results
+
+def element_text(element):
+    """Visible text of an element with each string stripped (like get_text(strip=True))"""
+    parts = []
+
+    def collect(node):
+        if node.text and isinstance(node.tag, str):
+            parts.append(node.text.strip())
+        for child in node:
+            if isinstance(child.tag, str) and child.tag not in NON_TEXT_TAGS:
+                collect(child)
+            if child.tail:
+                parts.append(child.tail.strip())
+
+    collect(element)
+    return ''.join(parts)
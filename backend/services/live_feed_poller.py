@@ -0,0 +1,190 @@
+import concurrent.futures
+import json
+import queue
+import threading
+import time
+from collections import OrderedDict
+from config.settings import (
+    LIVE_POLL_INTERVAL, LIVE_POLL_MAX_INTERVAL, LIVE_POLL_WORKERS, LIVE_BUFFER_SIZE,
+    SSE_HEARTBEAT_SECONDS, SSE_QUEUE_SIZE
+)
+from utils.ring_buffer import SequencedRingBuffer
+from utils.event_broadcaster import EventBroadcaster
+from utils.url_utils import article_key
+from .live_feed_service import live_feed_service
+
+class LiveFeedPoller:
+    """Background poller that refreshes each live source on its own interval and appends
+    new headlines to a ring buffer, so cursor readers never trigger scraping"""
+
+    def __init__(self, scraper, interval=LIVE_POLL_INTERVAL, max_interval=LIVE_POLL_MAX_INTERVAL,
+                 workers=LIVE_POLL_WORKERS, capacity=LIVE_BUFFER_SIZE):
+        self.scraper = scraper
+        self.interval = interval
+        self.max_interval = max_interval
+        self.workers = workers
+        # Starting from the clock keeps cursors increasing across restarts
+        self.buffer = SequencedRingBuffer(capacity, start_seq=int(time.time() * 1000))
+        # Keys of recently buffered items; kept longer than the buffer so an evicted
+        # item that is still in its feed does not come back as new
+        self.seen = OrderedDict()
+        self.seen_capacity = capacity * 4
+        self.broadcaster = EventBroadcaster(SSE_QUEUE_SIZE)  # Pushes new items to SSE streams
+        self.sources = {}
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """Start polling (no-op if already running)"""
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                return False
+
+            now = time.monotonic()
+            for category, urls in self.scraper.live_sources.items():
+                for url in urls:
+                    self.sources.setdefault(url, {
+                        'category': category,
+                        'interval': self.interval,
+                        'next_poll': now,
+                        'last_poll': None,
+                        'polls': 0,
+                        'new_items': 0,
+                        'in_flight': False
+                    })
+
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+
+        print(f"✅ Live feed poller started ({len(self.sources)} sources)")
+        return True
+
+    def stop(self, timeout=10):
+        """Stop polling and wait for in-flight polls to finish"""
+        self.stop_event.set()
+        thread = self.thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def since(self, cursor, limit=None):
+        """(headlines newer than cursor with their 'seq', next cursor, True if the reader missed items)"""
+        entries, next_cursor, missed = self.buffer.since(cursor, limit)
+        return [dict(headline, seq=seq) for seq, (key, headline) in entries], next_cursor, missed
+
+    def stream(self, cursor=None, heartbeat=SSE_HEARTBEAT_SECONDS):
+        """Server-Sent Events for new headlines, resuming after cursor (Last-Event-ID) if given"""
+        replay_missed = cursor is not None
+        if cursor is None:
+            cursor = self.buffer.last_seq  # New client: only items from now on
+
+        subscriber = self.broadcaster.subscribe()
+        try:
+            yield f"retry: {int(heartbeat * 1000)}\n\n"
+
+            # Subscribed before replaying, so nothing published in between is lost;
+            # items that are both replayed and queued are skipped by sequence number
+            headlines, _, missed = self.since(cursor)
+            if missed and replay_missed:
+                yield "event: reset\ndata: {}\n\n"  # Client fell out of the buffer: refetch the feed
+            last_sent = cursor
+            for headline in headlines:
+                yield self._event(headline['seq'], headline)
+                last_sent = headline['seq']
+
+            while not subscriber.dropped:
+                try:
+                    seq, headline = subscriber.queue.get(timeout=heartbeat)
+                except queue.Empty:
+                    yield ": heartbeat\n\n"
+                    continue
+
+                if seq > last_sent:
+                    yield self._event(seq, dict(headline, seq=seq))
+                    last_sent = seq
+
+            # Too slow to keep up: tell the client where to resume and end the stream
+            yield f"event: dropped\ndata: {json.dumps({'cursor': last_sent})}\n\n"
+        finally:
+            self.broadcaster.unsubscribe(subscriber)
+
+    def _event(self, seq, headline):
+        return f"id: {seq}\nevent: headline\ndata: {json.dumps(headline)}\n\n"
+
+    def get_status(self):
+        """Buffer position and per-source polling schedule"""
+        now = time.monotonic()
+        with self.lock:
+            sources = {
+                url: {
+                    'category': state['category'],
+                    'interval_seconds': state['interval'],
+                    'next_poll_in_seconds': round(max(0, state['next_poll'] - now), 1),
+                    'polls': state['polls'],
+                    'new_items': state['new_items']
+                }
+                for url, state in self.sources.items()
+            }
+        return {
+            'running': self.thread is not None and self.thread.is_alive(),
+            'cursor': self.buffer.last_seq,
+            'buffered': len(self.buffer),
+            'streams': self.broadcaster.get_stats(),
+            'sources': sources
+        }
+
+    def _run(self):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while not self.stop_event.is_set():
+                now = time.monotonic()
+                with self.lock:
+                    due = [url for url, state in self.sources.items()
+                           if not state['in_flight'] and state['next_poll'] <= now]
+                    for url in due:
+                        self.sources[url]['in_flight'] = True
+                    next_poll = min((state['next_poll'] for state in self.sources.values()
+                                     if not state['in_flight']), default=now + 1)
+
+                for url in due:
+                    executor.submit(self.poll_source, url)
+
+                self.stop_event.wait(min(1.0, max(0.1, next_poll - now)))
+
+    def poll_source(self, url):
+        """Fetch one source and append its unseen headlines (oldest first)"""
+        state = self.sources[url]
+        new_count = 0
+        try:
+            headlines = self.scraper.fetch_source(url, state['category'])
+
+            # Feeds list newest first; appending in reverse gives the newest item the highest seq
+            for headline in reversed(headlines):
+                key = article_key(headline['source_url'], headline['headline'])
+                with self.lock:
+                    if key in self.seen:
+                        self.seen.move_to_end(key)
+                        continue
+                    self.seen[key] = True
+                    if len(self.seen) > self.seen_capacity:
+                        self.seen.popitem(last=False)
+
+                seq = self.buffer.append((key, headline))
+                self.broadcaster.publish(seq, headline)
+                new_count += 1
+
+        except Exception as e:
+            print(f"❌ Live poll failed for {url}: {e}")
+
+        finally:
+            with self.lock:
+                # Sources with news keep the base interval; quiet ones back off
+                state['interval'] = self.interval if new_count else min(self.max_interval, state['interval'] * 2)
+                state['next_poll'] = time.monotonic() + state['interval']
+                state['last_poll'] = time.time()
+                state['polls'] += 1
+                state['new_items'] += new_count
+                state['in_flight'] = False
+
+# Global poller sharing the live feed service's scraper
+live_feed_poller = LiveFeedPoller(live_feed_service.scraper)
@@ -1,19 +1,35 @@
-import requests
 import time
-import random
+import threading
 from bs4 import BeautifulSoup
-from datetime import datetime
+import heapq
+from datetime import datetime, timezone
 import concurrent.futures
 from urllib.parse import urljoin
-import feedparser
+from utils.request_scheduler import request_scheduler
+from utils.http_cache import http_cache
+from utils.http_client import http_client
+from utils.circuit_breaker import source_breaker
+from utils.feed_parser import iter_feed_items
+from utils.near_duplicates import StoryDeduplicator, source_rank, source_entry, source_name
+from utils.pattern_matcher import PatternMatcher
+from config.patterns import PATTERN_SETS
+from config.settings import LIVE_FEED_DEADLINE, LIVE_FEED_WORKERS
+
+quick_headline_filters = PatternMatcher(PATTERN_SETS['quick_headline_filters'])
+
+def _recency(headline):
+    """Sort key: publication time of a live headline as epoch seconds"""
+    try:
+        return datetime.fromisoformat(headline['timestamp']).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return 0.0
 
 class LiveFeedScraperService:
     """Lightweight scraper for instant headlines without analysis"""
     
     def __init__(self):
-        self.session = requests.Session()
-        # Minimal headers for speed
-        self.session.headers.update({
+        # Minimal headers for speed; the shared client gives each worker thread its own session
+        self.session = http_client.session({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
         })
@@ -39,79 +55,159 @@ class LiveFeedScraperService:
                 'https://feeds.bbci.co.uk/sport/rss.xml'
             ]
         }
+        
+        # Long-lived pool: fetches that miss a caller's deadline finish here and warm
+        # recent_results (and the HTTP cache) for the next call
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=LIVE_FEED_WORKERS)
+        self.in_flight = {}  # source_url -> future of the running fetch
+        self.recent_results = {}  # source_url -> headlines of its last completed fetch
+        self.lock = threading.Lock()
     
-    def get_quick_headlines(self, limit=30):
+    def get_quick_headlines(self, limit=30, deadline=None):
         """Get headlines quickly without analysis"""
+        return self.collect_headlines(limit, deadline)['headlines']
+    
+    def collect_headlines(self, limit=30, deadline=None):
+        """Headlines from the sources that answer within deadline seconds (default LIVE_FEED_DEADLINE).
+        
+        Sources still running at the deadline are reported as pending and keep going in
+        the background; their last completed results stand in for them meanwhile.
+        Quarantined sources are reported as skipped.
+        """
         print("Fetching live feed headlines...")
-        all_headlines = []
+        if deadline is None:
+            deadline = LIVE_FEED_DEADLINE
         
-        # Use concurrent processing for speed
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            future_to_category = {}
-            
-            for category, sources in self.live_sources.items():
-                for source in sources:
-                    future = executor.submit(self._fetch_from_source, source, category)
-                    future_to_category[future] = (source, category)
-            
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_category, timeout=10):
-                source, category = future_to_category[future]
-                try:
-                    headlines = future.result()
-                    all_headlines.extend(headlines)
-                except Exception as e:
-                    print(f"Error fetching from {source}: {e}")
-        
-        # Remove duplicates and limit results
-        unique_headlines = self._remove_duplicates(all_headlines)
-        return unique_headlines[:limit]
+        futures = {}
+        for category, sources in self.live_sources.items():
+            for source in sources:
+                futures[self._submit_fetch(source, category)] = source
+        
+        done, not_done = concurrent.futures.wait(futures, timeout=deadline)
+        
+        runs = []  # One newest-first run of headlines per source
+        skipped = []
+        for future in done:
+            headlines = future.result()
+            if headlines is None:
+                skipped.append(futures[future])
+            else:
+                runs.append(headlines)
+        
+        pending = [futures[future] for future in not_done]
+        with self.lock:
+            for source in pending:
+                runs.append(self.recent_results.get(source, []))
+        
+        if pending:
+            print(f"⚠️ Live feed deadline ({deadline}s) hit, {len(pending)} sources still loading")
+        
+        return {
+            'headlines': self._merge_newest(runs, limit),
+            'pending': sorted(pending),
+            'skipped': sorted(skipped)
+        }
+    
+    def latest_headlines(self, limit=30):
+        """collect_headlines from the last completed fetches only, without starting or waiting for any"""
+        with self.lock:
+            runs = list(self.recent_results.values())
+            pending = sorted(self.in_flight)
+        return {'headlines': self._merge_newest(runs, limit), 'pending': pending, 'skipped': []}
+    
+    def _submit_fetch(self, source_url, category):
+        """Future for a source fetch, reusing one that is still running from an earlier call"""
+        with self.lock:
+            future = self.in_flight.get(source_url)
+            if future is not None:
+                return future  # Its callback was added when it was created
+            future = self.executor.submit(self._fetch_guarded, source_url, category)
+            self.in_flight[source_url] = future
+        
+        # Once per future, outside the lock: the callback runs right away if the fetch already finished
+        future.add_done_callback(lambda f: self._fetch_done(source_url, f))
+        return future
+    
+    def _fetch_guarded(self, source_url, category):
+        """Headlines of a source, or None if its circuit breaker skipped it"""
+        if not source_breaker.allow(source_url):
+            return None
+        return self._fetch_allowed(source_url, category)
+    
+    def _fetch_done(self, source_url, future):
+        with self.lock:
+            # Only drop the entry if it is still this fetch, never a newer one for the source
+            if self.in_flight.get(source_url) is future:
+                del self.in_flight[source_url]
+            if not future.cancelled() and future.exception() is None and future.result() is not None:
+                self.recent_results[source_url] = future.result()
+    
+    def fetch_source(self, source_url, category):
+        """Headlines of a single live source (conditional GET, circuit breaker applies)"""
+        return self._fetch_from_source(source_url, category)
     
     def _fetch_from_source(self, source_url, category):
         """Fetch headlines from a single source"""
+        # Quarantined sources would only add their timeout to the live feed
+        if not source_breaker.allow(source_url):
+            return []
+        return self._fetch_allowed(source_url, category)
+    
+    def _fetch_allowed(self, source_url, category):
+        """Fetch a source the circuit breaker has already let through"""
         try:
-            # Minimal delay for responsiveness
-            time.sleep(random.uniform(0.05, 0.1))
+            headers, cached = http_cache.lookup('live_feed', source_url)
+            
+            # Per-host scheduler keeps parallel workers from bursting one host
+            response = request_scheduler.get(self.session, source_url, timeout=5, headers=headers)
+            if response.status_code == 304 and cached is not None:
+                source_breaker.record_success(source_url)
+                return cached
             
-            response = self.session.get(source_url, timeout=5)
             response.raise_for_status()
+            source_breaker.record_success(source_url)
             
             # Parse RSS feed
             if source_url.endswith('.xml') or 'rss' in source_url or 'feed' in source_url:
-                return self._parse_rss_quick(response.content, category, source_url)
+                headlines = self._parse_rss_quick(response.content, category, source_url)
             else:
                 # Fallback to HTML parsing
-                return self._parse_html_quick(response.content, category, source_url)
+                headlines = self._parse_html_quick(response.content, category, source_url)
+            
+            http_cache.store('live_feed', source_url, response, headlines)
+            return headlines
                 
         except Exception as e:
             print(f"Error fetching from {source_url}: {e}")
+            source_breaker.record_failure(source_url, e)
             return []
     
     def _parse_rss_quick(self, content, category, source_url):
         """Quick RSS parsing without detailed analysis"""
         headlines = []
+        fetched_at = datetime.now(timezone.utc).isoformat()
         
         try:
-            # Use feedparser for reliable RSS parsing
-            feed = feedparser.parse(content)
-            
-            for entry in feed.entries[:8]:  # Limit per source for speed
-                if hasattr(entry, 'title') and entry.title:
-                    headline_text = entry.title.strip()
-                    
-                    if self._is_valid_quick_headline(headline_text):
-                        headlines.append({
-                            'headline': headline_text,
-                            'source': self._extract_source_name(source_url),
-                            'category': category,
-                            'timestamp': datetime.now().isoformat(),
-                            'source_url': entry.link if hasattr(entry, 'link') else source_url,
-                            'quick_id': f"live_{len(headlines)}_{int(time.time())}"
-                        })
+            # Streaming parser stops after the first items instead of parsing the whole feed
+            for item in iter_feed_items(content, limit=8):  # Limit per source for speed
+                headline_text = item['title']
+                
+                if self._is_valid_quick_headline(headline_text):
+                    headlines.append({
+                        'headline': headline_text,
+                        'source': self._extract_source_name(source_url),
+                        'category': category,
+                        'timestamp': item['published'] or fetched_at,  # Undated items count as just published
+                        'published': item['published'],
+                        'source_url': item['link'] or source_url,
+                        'quick_id': f"live_{len(headlines)}_{int(time.time())}"
+                    })
             
         except Exception as e:
             print(f"Error parsing RSS from {source_url}: {e}")
         
+        # Keep each source a newest-first run for the k-way merge
+        headlines.sort(key=_recency, reverse=True)
         return headlines
     
     def _parse_html_quick(self, content, category, source_url):
@@ -135,7 +231,8 @@ class LiveFeedScraperService:
                             'headline': headline_text,
                             'source': self._extract_source_name(source_url),
                             'category': category,
-                            'timestamp': datetime.now().isoformat(),
+                            'timestamp': datetime.now(timezone.utc).isoformat(),
+                            'published': None,
                             'source_url': source_url,
                             'quick_id': f"live_{len(headlines)}_{int(time.time())}"
                         })
@@ -157,49 +254,25 @@ class LiveFeedScraperService:
             return False
         
         # Quick filter for obvious non-headlines
-        invalid_patterns = ['cookie', 'privacy', 'subscribe', 'newsletter', 'click here']
-        text_lower = text.lower()
-        
-        return not any(pattern in text_lower for pattern in invalid_patterns)
+        return not quick_headline_filters.matches_any(text)
     
     def _extract_source_name(self, url):
         """Extract readable source name from URL"""
-        source_names = {
-            'reuters.com': 'Reuters',
-            'bbc.co.uk': 'BBC',
-            'cnn.com': 'CNN',
-            'techcrunch.com': 'TechCrunch',
-            'theverge.com': 'The Verge',
-            'arstechnica.com': 'Ars Technica',
-            'bloomberg.com': 'Bloomberg',
-            'espn.com': 'ESPN'
-        }
-        
-        for domain, name in source_names.items():
-            if domain in url:
-                return name
-        
-        # Fallback to domain extraction
-        try:
-            from urllib.parse import urlparse
-            domain = urlparse(url).netloc
-            return domain.replace('www.', '').replace('feeds.', '').title()
-        except:
-            return 'News Source'
+        return source_name(url)
     
-    def _remove_duplicates(self, headlines):
-        """Remove duplicate headlines based on text similarity"""
-        unique_headlines = []
-        seen_headlines = set()
+    def _merge_newest(self, runs, limit):
+        """The limit newest unique headlines from newest-first per-source runs.
         
-        for headline in headlines:
-            headline_text = headline['headline'].lower().strip()
-            
-            # Simple duplicate detection
-            if headline_text not in seen_headlines:
-                seen_headlines.add(headline_text)
-                unique_headlines.append(headline)
-        
-        # Sort by timestamp (newest first)
-        unique_headlines.sort(key=lambda x: x['timestamp'], reverse=True)
-        return unique_headlines
+        A heap-based k-way merge pops headlines newest first and each is offered to the
+        near-duplicate index as it comes out, stopping once limit stories are found, so
+        only about limit headlines are hashed. A story keeps the place of its newest copy
+        and shows its best-sourced one among those popped.
+        """
+        merged = heapq.merge(*runs, key=_recency, reverse=True)
+        return StoryDeduplicator().deduplicate(
+            merged,
+            text=lambda headline: headline['headline'],
+            source=lambda headline: source_entry(headline['source_url'], headline['source']),
+            rank=lambda headline: source_rank(headline['source_url']),
+            limit=limit
+        )
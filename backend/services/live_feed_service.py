@@ -1,25 +1,45 @@
 from .live_feed_scraper import LiveFeedScraperService
 from .supabase_client import supabase_db
+from config.settings import LIVE_FEED_TTL, LIVE_FEED_MAX_STALE, LIVE_FEED_DEADLINE
+from utils.single_flight import single_flight
 import threading
 import time
 
 class LiveFeedService:
     """Service to manage live feed operations"""
     
-    def __init__(self):
+    def __init__(self, ttl=LIVE_FEED_TTL, max_stale=LIVE_FEED_MAX_STALE):
         self.scraper = LiveFeedScraperService()
-        self.is_fetching = False
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.snapshot = None  # Last successful fetch: {'headlines', 'timestamp', 'total'}
+        self.snapshot_time = None  # time.monotonic() of the snapshot
+        self.last_error = None
+        self.lock = threading.Lock()
     
-    def get_live_feed(self, force_refresh=False):
-        """Get live feed headlines with caching"""
+    def get_live_feed(self, force_refresh=False, deadline=None):
+        """Get live feed headlines, serving the cached snapshot and revalidating it in the background.
+        
+        deadline (seconds) bounds a blocking fetch; sources that miss it are listed as pending.
+        """
         try:
-            # Check cache first unless force refresh
-            # The original code had Redis cache checks, which are removed.
-            # For now, we'll just fetch fresh data.
+            snapshot, age = self._current_snapshot()
             
-            # Fetch fresh data
-            return self._fetch_fresh_headlines()
+            # No usable snapshot (or an explicit refresh): fetch before answering
+            if force_refresh or snapshot is None or age > self.max_stale:
+                result = self._fetch_fresh_headlines(deadline)
+                if result['success'] or snapshot is None:
+                    return result
+                
+                # Fetch failed: an old snapshot beats no headlines at all
+                return self._cached_result(snapshot, age, error=result.get('error'))
+            
+            # Stale: answer immediately, refresh for the next request
+            if self._is_stale(snapshot, age):
+                self.refresh_async()
             
+            return self._cached_result(snapshot, age)
+        
         except Exception as e:
             return {
                 'success': False,
@@ -27,68 +47,125 @@ class LiveFeedService:
                 'data': None
             }
     
-    def _fetch_fresh_headlines(self):
-        """Fetch fresh headlines from sources"""
+    def _current_snapshot(self):
+        """(snapshot, age in seconds) or (None, None)"""
+        with self.lock:
+            if self.snapshot is None:
+                return None, None
+            return self.snapshot, time.monotonic() - self.snapshot_time
+    
+    def _is_stale(self, snapshot, age):
+        # A partial snapshot is refreshed on the next request, once its stragglers have landed
+        return age > self.ttl or bool(snapshot.get('pending'))
+    
+    def _cached_result(self, snapshot, age, error=None):
+        result = {
+            'success': True,
+            'data': snapshot,
+            'from_cache': True,
+            'age_seconds': round(age, 1),
+            'stale': self._is_stale(snapshot, age)
+        }
+        if error:
+            result['error'] = error
+        return result
+    
+    def _fetch_fresh_headlines(self, deadline=None):
+        """Fetch fresh headlines; concurrent callers share one fetch but each keeps its own deadline"""
+        try:
+            return single_flight.do(
+                'live_feed', self._fetch_and_cache, deadline,
+                wait_timeout=LIVE_FEED_DEADLINE if deadline is None else deadline
+            )
+        except TimeoutError:
+            # Joined a fetch running on a longer deadline (e.g. a background refresh):
+            # answer with what is there now rather than wait for it
+            snapshot, age = self._current_snapshot()
+            if snapshot is not None:
+                return self._cached_result(snapshot, age)
+            return self._partial_result(self.scraper.latest_headlines(limit=30))
+    
+    def _fetch_and_cache(self, deadline=None):
+        """Fetch fresh headlines from sources and replace the snapshot"""
         try:
-            # The original code had Redis status updates, which are removed.
-            # For now, we'll just proceed with fetching.
-            
             # Get headlines from scraper
-            headlines = self.scraper.get_quick_headlines(limit=30)
+            collected = self.scraper.collect_headlines(limit=30, deadline=deadline)
+            headlines = collected['headlines']
             
             if headlines:
-                # Store in Redis
+                snapshot = {
+                    'headlines': headlines,
+                    'timestamp': time.time(),
+                    'total': len(headlines),
+                    'pending': collected['pending'],
+                    'skipped': collected['skipped']
+                }
+                with self.lock:
+                    self.snapshot = snapshot
+                    self.snapshot_time = time.monotonic()
+                    self.last_error = None
+                
+                # Keep the database copy for clients that read it directly
                 supabase_db.store_live_headlines(headlines)
                 
                 return {
                     'success': True,
-                    'data': {
-                        'headlines': headlines,
-                        'timestamp': time.time(),
-                        'total': len(headlines)
-                    },
-                    'from_cache': False
+                    'data': snapshot,
+                    'from_cache': False,
+                    'age_seconds': 0.0,
+                    'stale': bool(collected['pending'])
                 }
+            elif collected['pending']:
+                # Nothing back within the deadline yet: not an error, the client can retry shortly
+                return self._partial_result(collected)
             else:
-                # The original code had Redis status updates, which are removed.
-                # For now, we'll just return an error.
+                self.last_error = 'No headlines found'
                 return {
                     'success': False,
                     'error': 'No headlines found',
                     'data': None
                 }
-                
+        
         except Exception as e:
-            # The original code had Redis status updates, which are removed.
-            # For now, we'll just return an error.
+            self.last_error = str(e)
             return {
                 'success': False,
                 'error': str(e),
                 'data': None
             }
     
-    def refresh_async(self):
-        """Refresh live feed in background"""
-        if not self.is_fetching:
-            self.is_fetching = True
-            thread = threading.Thread(target=self._background_refresh)
-            thread.daemon = True
-            thread.start()
+    def _partial_result(self, collected):
+        """Uncached answer for headlines collected while sources are still pending"""
+        return {
+            'success': True,
+            'data': {
+                'headlines': collected['headlines'],
+                'timestamp': time.time(),
+                'total': len(collected['headlines']),
+                'pending': collected['pending'],
+                'skipped': collected['skipped']
+            },
+            'from_cache': False,
+            'age_seconds': 0.0,
+            'stale': True
+        }
     
-    def _background_refresh(self):
-        """Background refresh method"""
-        try:
-            self._fetch_fresh_headlines()
-        finally:
-            self.is_fetching = False
+    def refresh_async(self):
+        """Refresh live feed in background unless a fetch is already in flight"""
+        return single_flight.do_async('live_feed', self._fetch_and_cache)
     
     def get_status(self):
         """Get current live feed status"""
-        # The original code had Redis status retrieval, which is removed.
-        # For now, we'll return a placeholder.
+        snapshot, age = self._current_snapshot()
         return {
-            'status': 'Service is running',
-            'last_refresh': 'N/A'
+            'status': 'refreshing' if single_flight.in_flight('live_feed') else 'Service is running',
+            'last_refresh': snapshot['timestamp'] if snapshot else 'N/A',
+            'age_seconds': round(age, 1) if snapshot else None,
+            'stale': self._is_stale(snapshot, age) if snapshot else None,
+            'pending_sources': snapshot.get('pending', []) if snapshot else [],
+            'total': snapshot['total'] if snapshot else 0,
+            'ttl_seconds': self.ttl,
+            'last_error': self.last_error
         }
 
 # Global live feed service
@@ -1,58 +1,36 @@
 import json
 from config.settings import NEWS_SOURCES
 from .news_scraper import NewsScraperService
-from .sentiment_analyzer import SentimentAnalyzer
+from .crawl_engine import CrawlPipeline
+from .sentiment_analyzer import sentiment_analyzer
 
 from services.global_database import global_db
 from .supabase_client import supabase_db
+from utils.seen_index import seen_index
+from utils.single_flight import single_flight
 
 class NewsProcessingService:
     """Service for processing and storing news data with enhanced image support"""
     
     def __init__(self):
         self.scraper = NewsScraperService()
-        self.sentiment_analyzer = SentimentAnalyzer()
+        self.sentiment_analyzer = sentiment_analyzer  # Shared, so its memo outlives this service
+        self.crawl_engine = CrawlPipeline(self.scraper, self.sentiment_analyzer)
     
     def crawl_and_process_news(self):
-        """Enhanced crawl that stores in global database"""
+        """Enhanced crawl that stores in global database (overlapping triggers share one crawl)"""
+        return single_flight.do('crawl', self._crawl_and_process)
+    
+    def _crawl_and_process(self):
+        """Run one crawl through the pipeline and publish it to the global database"""
         print("Starting global news crawl with database storage...")
         
-        all_headlines = []
+        seen_index.prune()
+        
+        # Staged pipeline: fetch -> parse -> enrich -> analyze -> store
+        all_headlines, new_count = self.crawl_engine.crawl(NEWS_SOURCES)
+        self._report_pipeline_stats()
         
-        # Your existing crawling logic...
-        for category, sources in NEWS_SOURCES.items():
-            print(f"Processing {category} news...")
-            
-            for source in sources:
-                headlines = self.scraper.scrape_headlines(source, category)
-                
-                if headlines:
-                    for headline_data in headlines:
-                        try:
-                            # Your existing sentiment analysis
-                            sentiment_result = self.sentiment_analyzer.analyze_sentiment(
-                                headline_data['headline']
-                            )
-                            
-                            # Combine data for global storage
-                            news_item = {
-                                'headline': headline_data['headline'],
-                                'category': category,
-                                'sentiment': sentiment_result['sentiment'],
-                                'confidence': sentiment_result['confidence'],
-                                'source_url': headline_data.get('source_url', ''),
-                                'image_url': headline_data.get('image_url', '')
-                            }
-                            
-                            all_headlines.append(news_item)
-                            
-                            # Still store in Redis for immediate API access
-                            supabase_db.store_headline(news_item)
-                            
-                        except Exception as e:
-                            print(f"Error processing headline: {e}")
-                            continue
-    
         # Store in global database for mobile sync
         if all_headlines:
             try:
@@ -61,5 +39,19 @@ class NewsProcessingService:
             except Exception as e:
                 print(f"❌ Global database storage failed: {e}")
         
-        print(f"Global crawl completed. Total headlines: {len(all_headlines)}")
+        print(f"Global crawl completed. Total headlines: {len(all_headlines)} ({new_count} new)")
         return len(all_headlines)
+    
+    def _report_pipeline_stats(self):
+        """Print per-stage counters so the limiting stage is visible"""
+        stats = self.crawl_engine.get_stats()
+        print(f"📊 Crawl pipeline finished in {stats['elapsed_seconds']}s ({stats['near_duplicates']} cross-source duplicates)")
+        cache = stats['sentiment_cache']
+        print(f"   sentiment memo: {cache['hits']} hits, {cache['misses']} misses ({cache['size']} cached)")
+        pool = stats['cpu_pool']
+        print(f"   cpu pool: {pool['workers']} workers, {pool['chunks']} chunks, {pool['inline']} inline calls")
+        for name, stage in stats['stages'].items():
+            print(
+                f"   {name}: {stage['processed']} items, {stage['items_per_second']}/s, "
+                f"utilization {stage['utilization']}, max queue {stage['max_queue_depth']}, errors {stage['errors']}"
+            )
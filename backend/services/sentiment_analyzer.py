@@ -1,8 +1,91 @@
 from textblob import TextBlob
+from collections import OrderedDict
+import threading
+from config.settings import SENTIMENT_MEMO_SIZE, SENTIMENT_BACKEND
+from utils.url_utils import headline_hash
+from utils.lexicon_sentiment import lexicon_sentiment
+from utils.worker_pool import cpu_pool
+
+def _score_in_worker(texts):
+    """Score a chunk of texts inside a worker process"""
+    return SentimentAnalyzer.score_batch(texts)
+
+def _warm_sentiment():
+    """Load the configured backend's lexicon before a worker takes its first chunk"""
+    SentimentAnalyzer.score_batch(['warm up'])
 
 class SentimentAnalyzer:
     """Enhanced sentiment analysis using TextBlob"""
     
+    def __init__(self, memo_size=SENTIMENT_MEMO_SIZE, pool=None):
+        self.memo = OrderedDict()  # Normalized headline hash -> result, least recently used first
+        self.memo_size = memo_size
+        self.pool = pool  # Optional WarmProcessPool that scores memo misses in chunks
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+    
+    def analyze_batch(self, texts, score_batch=None):
+        """
+        Analyze a list of texts; results are in input order and have the analyze_sentiment format.
+        Texts seen before (ignoring case and whitespace) are answered from the LRU memo;
+        score_batch(texts) scores the rest (defaults to the worker pool, else score_batch below).
+        """
+        keys = [headline_hash(text or '') for text in texts]
+        missing = {}
+        
+        with self.lock:
+            for key, text in zip(keys, texts):
+                if key in self.memo:
+                    self.memo.move_to_end(key)
+                    self.hits += 1
+                elif key in missing:
+                    self.hits += 1  # Repeated within the batch: scored once
+                else:
+                    missing[key] = text
+                    self.misses += 1
+            found = {key: self.memo[key] for key in keys if key in self.memo}
+        
+        if missing:
+            if score_batch is None and self.pool is not None:
+                scored = self.pool.map_chunks(_score_in_worker, missing.values())
+            else:
+                scored = (score_batch or self.score_batch)(list(missing.values()))
+            found.update(zip(missing, scored))
+            
+            with self.lock:
+                for key in missing:
+                    self.memo[key] = found[key]
+                    self.memo.move_to_end(key)
+                while len(self.memo) > self.memo_size:
+                    self.memo.popitem(last=False)
+        
+        # Copies, so callers can't change the memoized results
+        return [dict(found[key]) for key in keys]
+    
+    @staticmethod
+    def score_batch(texts, backend=None):
+        """Analyze each text without the memo, with the configured backend"""
+        if (backend or SENTIMENT_BACKEND) == 'lexicon' and lexicon_sentiment.available:
+            try:
+                # NumPy lexicon engine: same polarity as TextBlob, scored for the whole batch at once
+                return [SentimentAnalyzer.result(float(polarity)) for polarity in lexicon_sentiment.polarity(texts)]
+            except Exception as e:
+                print(f"⚠️ Lexicon sentiment failed, falling back to TextBlob: {e}")
+        return [SentimentAnalyzer.analyze_sentiment(text) for text in texts]
+    
+    def get_stats(self):
+        """Memo size and hit/miss counters"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.memo),
+                'capacity': self.memo_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0
+            }
+    
     @staticmethod
     def analyze_sentiment(text):
         """
@@ -10,24 +93,7 @@ class SentimentAnalyzer:
         """
         try:
             blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
-            
-            # Convert polarity (-1 to 1) to confidence percentage
-            confidence = min(abs(polarity) * 100, 100)
-            
-            # Determine sentiment label
-            if polarity > 0.1:
-                sentiment = 'positive'
-            elif polarity < -0.1:
-                sentiment = 'negative'
-            else:
-                sentiment = 'neutral'
-            
-            return {
-                'sentiment': sentiment,
-                'confidence': round(confidence, 1),
-                'raw_score': round(polarity, 3)
-            }
+            return SentimentAnalyzer.result(blob.sentiment.polarity)
         except Exception as e:
             print(f"Error analyzing sentiment: {e}")
             return {
@@ -35,3 +101,27 @@ class SentimentAnalyzer:
                 'confidence': 0,
                 'raw_score': 0
             }
+    
+    @staticmethod
+    def result(polarity):
+        """Sentiment label, confidence and raw score for a polarity"""
+        # Convert polarity (-1 to 1) to confidence percentage
+        confidence = min(abs(polarity) * 100, 100)
+        
+        # Determine sentiment label
+        if polarity > 0.1:
+            sentiment = 'positive'
+        elif polarity < -0.1:
+            sentiment = 'negative'
+        else:
+            sentiment = 'neutral'
+        
+        return {
+            'sentiment': sentiment,
+            'confidence': round(confidence, 1),
+            'raw_score': round(polarity, 3)
+        }
+
+# Global analyzer whose memo lives as long as the process; misses are scored by the CPU pool
+cpu_pool.add_warmer(_warm_sentiment)
+sentiment_analyzer = SentimentAnalyzer(pool=cpu_pool)
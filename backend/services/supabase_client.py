@@ -2,6 +2,11 @@ import time
 from supabase import create_client, Client
 import os
 from datetime import datetime
+from config.settings import LIVE_FEED_INCREMENTAL_SYNC
+from utils.url_utils import article_key
+
+# Columns of live_feed_headlines
+LIVE_FEED_COLUMNS = ('headline', 'source', 'category', 'timestamp', 'source_url', 'quick_id')
 
 class SupabaseService:
     """Enhanced Supabase client with transaction error handling"""
@@ -11,6 +16,7 @@ class SupabaseService:
         key = os.getenv('SUPABASE_ANON_KEY')
         self.supabase: Client = create_client(url, key)
         self.max_retries = 3
+        self.live_rows = None  # Live key -> row ids in live_feed_headlines; None until loaded
     
     def store_global_update(self, headlines_data):
         """Store news update with robust error handling and retry logic"""
@@ -194,16 +200,77 @@ class SupabaseService:
             return []
 
     def store_live_headlines(self, headlines):
-        """Store a batch of live feed headlines."""
+        """Sync the live feed table to this batch of headlines."""
+        if not LIVE_FEED_INCREMENTAL_SYNC:
+            return self._replace_live_headlines(headlines)
+
+        try:
+            if self.live_rows is None:
+                self.live_rows = self._load_live_rows()
+
+            current = {}
+            for headline in headlines:
+                current.setdefault(self._live_key(headline), headline)
+
+            new_keys = [key for key in current if key not in self.live_rows]
+            expired_keys = [key for key in self.live_rows if key not in current]
+
+            # Insert before deleting so readers never see the table empty
+            batch_size = 50
+            for i in range(0, len(new_keys), batch_size):
+                batch = new_keys[i:i + batch_size]
+                result = self.supabase.table('live_feed_headlines').insert([self._live_row(current[key]) for key in batch]).execute()
+                if not result.data or len(result.data) != len(batch):
+                    raise Exception("Insert did not return the new row ids")
+                for key, row in zip(batch, result.data):
+                    self.live_rows[key] = [row['id']]
+
+            # Expired rows, plus any second copy of a kept item left over from earlier syncs
+            expired_ids = [row_id for key in expired_keys for row_id in self.live_rows[key]]
+            expired_ids.extend(row_id for key in current for row_id in self.live_rows[key][1:])
+            for i in range(0, len(expired_ids), batch_size):
+                self.supabase.table('live_feed_headlines').delete().in_('id', expired_ids[i:i + batch_size]).execute()
+
+            self.live_rows = {key: self.live_rows[key][:1] for key in current}
+
+            stats = {
+                'inserted': len(new_keys),
+                'deleted': len(expired_ids),
+                'unchanged': len(current) - len(new_keys)
+            }
+            print(f"📊 Live feed sync: +{stats['inserted']} -{stats['deleted']} ({stats['unchanged']} unchanged)")
+            return stats
+        except Exception as e:
+            print(f"❌ Error syncing live feed headlines: {e}")
+            self.live_rows = None  # Unknown table state: reload it on the next sync
+            return None
+
+    def _replace_live_headlines(self, headlines):
+        """Replace the whole live feed table with this batch."""
         try:
             # Delete all old live feed headlines before inserting new
             self.supabase.table('live_feed_headlines').delete().neq('id', 0).execute()
-            result = self.supabase.table('live_feed_headlines').insert(headlines).execute()
+            result = self.supabase.table('live_feed_headlines').insert([self._live_row(headline) for headline in headlines]).execute()
             return result
         except Exception as e:
             print(f"❌ Error storing live feed headlines: {e}")
             return None
 
+    def _load_live_rows(self):
+        """Row ids currently in the live feed table, by live key."""
+        result = self.supabase.table('live_feed_headlines').select('id, headline, source_url').execute()
+        rows = {}
+        for row in result.data or []:
+            rows.setdefault(self._live_key(row), []).append(row['id'])
+        return rows
+
+    def _live_row(self, headline):
+        """Table columns of a live headline (in-memory extras like 'published' are not stored)."""
+        return {column: headline.get(column) for column in LIVE_FEED_COLUMNS}
+
+    def _live_key(self, headline):
+        return article_key(headline.get('source_url') or '', headline.get('headline') or '')
+
     def ping(self):
         """Check Supabase connection health."""
         try:
@@ -0,0 +1,9 @@
+import os
+import sys
+import tempfile
+
+# Tests import the backend packages (utils, services, config) directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Modules that open SQLite caches at import time write to a throwaway directory
+os.environ.setdefault('CACHE_DIR', tempfile.mkdtemp(prefix='newslie-tests-'))
@@ -0,0 +1,85 @@
+import pytest
+from utils import circuit_breaker
+from utils.circuit_breaker import SourceCircuitBreaker
+
+SOURCE = 'https://example.com/rss'
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the breaker's cooldowns"""
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker.time, 'monotonic', lambda: now[0])
+    return now
+
+@pytest.fixture
+def breaker(clock):
+    return SourceCircuitBreaker(failure_threshold=2, base_cooldown=10, max_cooldown=30, probe_timeout=5)
+
+def test_opens_after_the_failure_threshold(breaker):
+    breaker.record_failure(SOURCE, 'timeout')
+    assert breaker.allow(SOURCE)
+    breaker.record_failure(SOURCE, 'timeout')
+    assert not breaker.allow(SOURCE)
+
+    stats = breaker.get_stats()[SOURCE]
+    assert stats['state'] == 'open' and stats['skipped'] == 1 and stats['last_error'] == 'timeout'
+
+def test_success_resets_the_consecutive_failures(breaker):
+    breaker.record_failure(SOURCE)
+    breaker.record_success(SOURCE)
+    breaker.record_failure(SOURCE)
+    assert breaker.allow(SOURCE)
+
+def test_half_open_allows_a_single_probe(breaker, clock):
+    breaker.record_failure(SOURCE)
+    breaker.record_failure(SOURCE)
+    clock[0] += 10
+
+    assert breaker.allow(SOURCE)
+    assert not breaker.allow(SOURCE)
+    assert breaker.get_stats()[SOURCE]['state'] == 'half_open'
+
+def test_probe_that_never_reports_back_is_retried(breaker, clock):
+    breaker.record_failure(SOURCE)
+    breaker.record_failure(SOURCE)
+    clock[0] += 10
+    assert breaker.allow(SOURCE)
+
+    clock[0] += 5
+    assert breaker.allow(SOURCE)
+
+def test_failed_probe_doubles_the_cooldown_up_to_the_maximum(breaker, clock):
+    breaker.record_failure(SOURCE)
+    breaker.record_failure(SOURCE)
+    cooldowns = []
+    for _ in range(3):
+        clock[0] += breaker.get_stats()[SOURCE]['cooldown_seconds']
+        assert breaker.allow(SOURCE)
+        breaker.record_failure(SOURCE)
+        cooldowns.append(breaker.get_stats()[SOURCE]['cooldown_seconds'])
+
+    assert cooldowns == [20, 30, 30]
+    clock[0] += 29
+    assert not breaker.allow(SOURCE)
+    assert breaker.get_stats()[SOURCE]['retry_in_seconds'] == 1
+
+def test_successful_probe_closes_the_circuit_and_resets_the_backoff(breaker, clock):
+    breaker.record_failure(SOURCE)
+    breaker.record_failure(SOURCE)
+    clock[0] += 10
+    assert breaker.allow(SOURCE)
+    breaker.record_success(SOURCE)
+
+    stats = breaker.get_stats()[SOURCE]
+    assert stats['state'] == 'closed' and stats['trips'] == 0 and stats['cooldown_seconds'] == 0
+    assert breaker.allow(SOURCE) and breaker.allow(SOURCE)
+
+    breaker.record_failure(SOURCE)
+    breaker.record_failure(SOURCE)
+    assert breaker.get_stats()[SOURCE]['cooldown_seconds'] == 10
+
+def test_sources_are_tracked_independently(breaker):
+    breaker.record_failure(SOURCE)
+    breaker.record_failure(SOURCE)
+    assert not breaker.allow(SOURCE)
+    assert breaker.allow('https://other.example/rss')
@@ -0,0 +1,85 @@
+import pytest
+from utils.near_duplicates import MinHashLSH, StoryDeduplicator, shingles, similarity, source_entry, source_rank
+
+def same_story(first, second):
+    stories = StoryDeduplicator()
+    stories.offer('first', first, 'https://one.example/a', 2)
+    stories.offer('second', second, 'https://two.example/b', 2)
+    return len(stories.stories) == 1
+
+@pytest.mark.parametrize('first, second', [
+    ("Stocks rise as Fed holds rates steady", "Stocks fall as Fed holds rates steady"),
+    ("Ukraine war: Russia launches drone attack on Kyiv", "Ukraine war: Russia launches drone attack on Odesa"),
+    ("Biden to visit Japan next week", "Biden to visit Germany next week"),
+    ("Apple reports record quarterly revenue", "Flooding forces evacuations across northern Italy"),
+])
+def test_different_stories_stay_apart(first, second):
+    assert not same_story(first, second)
+
+@pytest.mark.parametrize('first, second', [
+    ("Reuters: Oil prices climb", "Oil prices climb on supply fears"),
+    ("Oil prices climb on supply fears - Reuters", "Oil prices climb on supply fears | BBC News"),
+    ("Apple unveils new iPhone with faster chip", "Apple unveils new iPhone with a faster chip"),
+    ("SpaceX launches 40 satellites", "SPACEX LAUNCHES 40 SATELLITES!"),
+])
+def test_same_story_is_merged(first, second):
+    assert same_story(first, second)
+
+def test_short_headlines_do_not_match_by_containment():
+    assert not same_story("Live", "Live updates: storm hits the coast overnight")
+
+def test_similarity_is_exact():
+    first, second = shingles("Biden to visit Japan next week"), shingles("Biden to visit Germany next week")
+    jaccard, containment = similarity(first, second)
+    assert jaccard == pytest.approx(0.5)
+    assert containment == pytest.approx(6 / 9)
+    assert similarity(set(), first) == (0.0, 0.0)
+
+def test_better_ranked_copy_replaces_the_first():
+    stories = StoryDeduplicator()
+    assert stories.offer(1, "Oil prices climb on supply fears", 'blog', 2)
+    assert stories.offer(2, "Oil prices climb on supply fears", 'reuters', 0)
+    assert not stories.offer(3, "Oil prices climb on supply fears", 'other', 3)
+
+    assert stories.is_best(2)
+    assert not stories.is_best(1)
+    assert stories.alternates(2) == ['blog', 'other']
+    assert stories.duplicates == 2
+
+def test_deduplicate_consumes_only_until_limit():
+    consumed = []
+
+    def headlines():
+        for number, text in enumerate(["Oil prices climb on supply fears", "Oil prices climb on supply fears today",
+                                       "Storm hits the coast overnight", "Parliament passes the budget bill",
+                                       "Never reached headline about something"]):
+            consumed.append(number)
+            yield {'text': text, 'url': f'https://site{number}.example/story'}
+
+    unique = StoryDeduplicator().deduplicate(
+        headlines(), text=lambda item: item['text'], source=lambda item: item['url'], rank=lambda item: 2, limit=3
+    )
+    assert [item['text'] for item in unique] == [
+        "Oil prices climb on supply fears", "Storm hits the coast overnight", "Parliament passes the budget bill"
+    ]
+    assert unique[0]['alternate_sources'] == ['https://site1.example/story']
+    assert consumed == [0, 1, 2, 3]
+
+def test_lsh_candidates_include_identical_signatures_only_once():
+    index = MinHashLSH(num_perm=16, bands=8)
+    signature = index.signature(shingles("Storm hits the coast overnight"))
+    index.add('a', signature)
+    assert index.query(signature) == {'a'}
+    assert index.signature(set()) is None
+    with pytest.raises(ValueError):
+        MinHashLSH(num_perm=10, bands=3)
+
+def test_source_rank_tiers():
+    assert source_rank('https://www.reuters.com/world/story') < source_rank('https://unknown-blog.example/post')
+
+def test_source_entry_shape():
+    assert source_entry('https://www.reuters.com/world/story') == {
+        'source': 'Reuters', 'source_url': 'https://www.reuters.com/world/story'
+    }
+    assert source_entry('https://www.example.org/a', 'Example') == {'source': 'Example', 'source_url': 'https://www.example.org/a'}
+    assert source_entry('https://news.example.org/a')['source'] == 'News.Example.Org'
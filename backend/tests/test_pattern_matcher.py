@@ -0,0 +1,44 @@
+import random
+from utils.pattern_matcher import PatternMatcher
+
+def naive_find(patterns_by_category, text):
+    """Reference result: plain substring checks"""
+    found = {}
+    for category, patterns in patterns_by_category.items():
+        for pattern in patterns:
+            if pattern and pattern.lower() in text.lower():
+                found.setdefault(category, set()).add(pattern.lower())
+    return found
+
+def test_overlapping_and_nested_patterns_are_all_found():
+    matcher = PatternMatcher({'words': ['he', 'she', 'his', 'hers']})
+    assert matcher.find('ushers') == {'words': {'he', 'she', 'hers'}}
+
+def test_matching_ignores_case():
+    matcher = PatternMatcher({'clickbait': ['You Won\'t Believe']})
+    assert matcher.find('YOU WON\'T BELIEVE this') == {'clickbait': {'you won\'t believe'}}
+
+def test_count_is_per_distinct_pattern():
+    matcher = PatternMatcher({'alarm': ['shocking', 'breaking'], 'source': ['reuters']})
+    assert matcher.count('Shocking! Shocking! Breaking news via Reuters') == {'alarm': 2, 'source': 1}
+
+def test_matches_any_can_be_limited_to_one_category():
+    matcher = PatternMatcher({'alarm': ['shocking'], 'source': ['reuters']})
+    assert matcher.matches_any('Reuters reports')
+    assert not matcher.matches_any('Reuters reports', category='alarm')
+    assert not matcher.matches_any('')
+
+def test_same_pattern_in_two_categories_reports_both():
+    matcher = PatternMatcher({'first': ['video'], 'second': ['video', '']})
+    assert matcher.find('watch the video') == {'first': {'video'}, 'second': {'video'}}
+
+def test_agrees_with_plain_substring_search():
+    rng = random.Random(7)
+    patterns = {
+        'a': [''.join(rng.choice('abc') for _ in range(rng.randint(1, 4))) for _ in range(15)],
+        'b': [''.join(rng.choice('abc') for _ in range(rng.randint(2, 5))) for _ in range(15)],
+    }
+    matcher = PatternMatcher(patterns)
+    for _ in range(200):
+        text = ''.join(rng.choice('abcABC ') for _ in range(rng.randint(0, 30)))
+        assert matcher.find(text) == naive_find(patterns, text)
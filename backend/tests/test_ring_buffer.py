@@ -0,0 +1,44 @@
+from utils.ring_buffer import SequencedRingBuffer
+
+def test_since_returns_newer_items_and_advances_the_cursor():
+    buffer = SequencedRingBuffer(capacity=10)
+    for item in 'abc':
+        buffer.append(item)
+
+    items, cursor, missed = buffer.since(1)
+    assert items == [(2, 'b'), (3, 'c')]
+    assert cursor == 3 and not missed
+    assert buffer.since(cursor) == ([], 3, False)
+
+def test_limit_keeps_the_oldest_items_and_the_cursor_resumes_after_them():
+    buffer = SequencedRingBuffer(capacity=10)
+    for item in 'abcde':
+        buffer.append(item)
+
+    items, cursor, _ = buffer.since(0, limit=2)
+    assert items == [(1, 'a'), (2, 'b')] and cursor == 2
+    items, cursor, _ = buffer.since(cursor, limit=2)
+    assert items == [(3, 'c'), (4, 'd')] and cursor == 4
+
+def test_reader_that_fell_behind_the_buffer_is_told_it_missed_items():
+    buffer = SequencedRingBuffer(capacity=3)
+    for item in 'abcdef':
+        buffer.append(item)
+
+    items, cursor, missed = buffer.since(1)
+    assert items == [(4, 'd'), (5, 'e'), (6, 'f')]
+    assert cursor == 6 and missed
+    assert not buffer.since(3)[2]  # Only item 4 onwards is new to this reader
+    assert not buffer.since(0)[2]  # A first read never counts as missing anything
+
+def test_cursor_ahead_of_the_log_starts_over():
+    buffer = SequencedRingBuffer(capacity=10, start_seq=100)
+    buffer.append('a')
+
+    items, cursor, missed = buffer.since(500)
+    assert items == [(101, 'a')] and cursor == 101 and not missed
+
+def test_capacity_bounds_the_buffer():
+    buffer = SequencedRingBuffer(capacity=2)
+    assert [buffer.append(item) for item in 'abc'] == [1, 2, 3]
+    assert len(buffer) == 2
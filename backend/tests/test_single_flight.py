@@ -0,0 +1,114 @@
+import threading
+import pytest
+from utils.single_flight import SingleFlight
+
+def start_leader(flight, key, release, result='result'):
+    """Run a call under key in a thread; it blocks until release is set"""
+    started = threading.Event()
+    outcome = {}
+
+    def func():
+        started.set()
+        release.wait(5)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def run():
+        try:
+            outcome['value'] = flight.do(key, func)
+        except Exception as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    assert started.wait(5)
+    return thread, outcome
+
+def join_in_thread(flight, key, **kwargs):
+    outcome = {}
+
+    def run():
+        try:
+            outcome['value'] = flight.do(key, lambda: 'joiner ran', **kwargs)
+        except Exception as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread, outcome
+
+def wait_for_waiters(flight, key, count):
+    for _ in range(500):
+        with flight.lock:
+            if flight.calls[key].waiters >= count:
+                return
+        threading.Event().wait(0.01)
+    raise AssertionError('joiners never arrived')
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    leader, leader_outcome = start_leader(flight, 'live:us', release)
+    joiners = [join_in_thread(flight, 'live:us') for _ in range(3)]
+    wait_for_waiters(flight, 'live:us', 3)
+    release.set()
+
+    for thread, outcome in [(leader, leader_outcome)] + joiners:
+        thread.join(5)
+        assert outcome == {'value': 'result'}
+    stats = flight.get_stats()['live']
+    assert stats['requests'] == 4 and stats['executions'] == 1 and stats['coalesced'] == 3
+    assert stats['in_flight'] == 0
+
+def test_exception_reaches_every_waiting_caller():
+    flight = SingleFlight()
+    release = threading.Event()
+    error = ValueError('source down')
+    leader, leader_outcome = start_leader(flight, 'crawl', release, result=error)
+    joiner, joiner_outcome = join_in_thread(flight, 'crawl')
+    wait_for_waiters(flight, 'crawl', 1)
+    release.set()
+
+    leader.join(5)
+    joiner.join(5)
+    assert leader_outcome['error'] is error
+    assert joiner_outcome['error'] is error
+    assert not flight.in_flight('crawl')
+
+def test_joiner_times_out_while_the_call_carries_on():
+    flight = SingleFlight()
+    release = threading.Event()
+    leader, leader_outcome = start_leader(flight, 'bulk', release)
+
+    with pytest.raises(TimeoutError):
+        flight.do('bulk', lambda: 'joiner ran', wait_timeout=0.05)
+    assert flight.in_flight('bulk')
+
+    release.set()
+    leader.join(5)
+    assert leader_outcome == {'value': 'result'}
+    assert flight.get_stats()['bulk']['timeouts'] == 1
+
+def test_calls_after_completion_run_again():
+    flight = SingleFlight()
+    calls = []
+    assert flight.do('live', lambda: calls.append(1) or len(calls)) == 1
+    assert flight.do('live', lambda: calls.append(1) or len(calls)) == 2
+
+def test_different_keys_do_not_coalesce():
+    flight = SingleFlight()
+    release = threading.Event()
+    leader, _ = start_leader(flight, 'live:us', release)
+    assert flight.do('live:gb', lambda: 'gb') == 'gb'
+    release.set()
+    leader.join(5)
+
+def test_do_async_skips_a_key_already_running():
+    flight = SingleFlight()
+    release = threading.Event()
+    leader, _ = start_leader(flight, 'crawl', release)
+    assert flight.do_async('crawl', lambda: None) is False
+    release.set()
+    leader.join(5)
+    assert flight.get_stats()['crawl']['coalesced'] == 1
@@ -0,0 +1,24 @@
+from utils.url_utils import article_key, canonicalize_url, headline_hash
+
+def test_tracking_parameters_are_dropped():
+    url = 'https://www.example.com/world/story/?utm_source=tw&utm_medium=social&fbclid=abc&ref=homepage'
+    assert canonicalize_url(url) == 'https://example.com/world/story'
+
+def test_parameters_that_only_start_with_ref_are_kept():
+    for key in ('refid', 'reference', 'referrer_id'):
+        assert canonicalize_url(f'https://example.com/story?{key}=1') == f'https://example.com/story?{key}=1'
+
+def test_different_articles_keep_different_keys():
+    assert canonicalize_url('https://example.com/story?refid=1') != canonicalize_url('https://example.com/story?refid=2')
+
+def test_query_order_host_case_and_fragment_do_not_matter():
+    assert (canonicalize_url('HTTPS://Example.com:443/story?b=2&a=1#top') ==
+            canonicalize_url('https://example.com/story?a=1&b=2'))
+
+def test_headline_hash_ignores_case_and_spacing():
+    assert headline_hash('Storm  hits the COAST') == headline_hash(' storm hits the coast ')
+    assert headline_hash('Storm hits the coast') != headline_hash('Storm hits the city')
+
+def test_article_key_uses_the_canonical_url():
+    assert (article_key('https://www.example.com/story/?utm_source=x', 'Storm hits the coast') ==
+            article_key('https://example.com/story', 'storm hits the coast'))
@@ -0,0 +1,114 @@
+import threading
+import time
+from config.settings import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_BASE_COOLDOWN, CIRCUIT_MAX_COOLDOWN
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+class _SourceState:
+    """Breaker state and failure counters for one source"""
+
+    def __init__(self):
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.failures = 0
+        self.successes = 0
+        self.trips = 0  # Times opened since the source last recovered
+        self.opened_at = None
+        self.cooldown = 0.0
+        self.probe_started = None
+        self.last_error = None
+        self.skipped = 0
+
+class SourceCircuitBreaker:
+    """Per-source circuit breaker: closed -> open after repeated failures -> half-open probe.
+
+    An open source is skipped until its cooldown ends; the cooldown doubles each time the
+    half-open probe fails (up to max_cooldown) and resets once the source succeeds again.
+    """
+
+    def __init__(self, failure_threshold=CIRCUIT_FAILURE_THRESHOLD, base_cooldown=CIRCUIT_BASE_COOLDOWN,
+                 max_cooldown=CIRCUIT_MAX_COOLDOWN, probe_timeout=60):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.probe_timeout = probe_timeout  # A probe that never reported back is retried after this
+        self.sources = {}
+        self.lock = threading.Lock()
+
+    def allow(self, source):
+        """True if a request to the source may go ahead (a half-open source allows one probe)"""
+        now = time.monotonic()
+        with self.lock:
+            state = self.sources.setdefault(source, _SourceState())
+
+            if state.state == OPEN and now - state.opened_at >= state.cooldown:
+                state.state = HALF_OPEN
+                state.probe_started = None
+
+            if state.state == HALF_OPEN and (state.probe_started is None or now - state.probe_started >= self.probe_timeout):
+                state.probe_started = now
+                return True
+
+            if state.state == CLOSED:
+                return True
+
+            state.skipped += 1
+            return False
+
+    def record_success(self, source):
+        with self.lock:
+            state = self.sources.setdefault(source, _SourceState())
+            if state.state != CLOSED:
+                print(f"✅ Source recovered, closing circuit: {source}")
+            state.state = CLOSED
+            state.successes += 1
+            state.consecutive_failures = 0
+            state.trips = 0
+            state.cooldown = 0.0
+            state.probe_started = None
+
+    def record_failure(self, source, error=None):
+        now = time.monotonic()
+        with self.lock:
+            state = self.sources.setdefault(source, _SourceState())
+            state.failures += 1
+            state.consecutive_failures += 1
+            state.last_error = str(error) if error else None
+
+            if state.state == HALF_OPEN or state.consecutive_failures >= self.failure_threshold:
+                state.trips += 1
+                state.cooldown = min(self.max_cooldown, self.base_cooldown * 2 ** (state.trips - 1))
+                state.state = OPEN
+                state.opened_at = now
+                state.probe_started = None
+                print(f"⚠️ Circuit open for {source} ({state.last_error}) - skipping for {int(state.cooldown)}s")
+
+    def record(self, source, success, error=None):
+        if success:
+            self.record_success(source)
+        else:
+            self.record_failure(source, error)
+
+    def get_stats(self):
+        """State, counters and remaining cooldown for every source seen so far"""
+        now = time.monotonic()
+        with self.lock:
+            return {
+                source: {
+                    'state': state.state,
+                    'consecutive_failures': state.consecutive_failures,
+                    'failures': state.failures,
+                    'successes': state.successes,
+                    'skipped': state.skipped,
+                    'trips': state.trips,
+                    'cooldown_seconds': round(state.cooldown),
+                    'retry_in_seconds': round(max(0, state.opened_at + state.cooldown - now)) if state.state == OPEN else 0,
+                    'last_error': state.last_error
+                }
+                for source, state in self.sources.items()
+            }
+
+# Global breaker shared by the crawl and the live feed
+source_breaker = SourceCircuitBreaker()
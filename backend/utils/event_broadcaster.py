@@ -0,0 +1,56 @@
+import queue
+import threading
+
+class Subscriber:
+    """One consumer's bounded send queue; a consumer that falls behind is dropped"""
+
+    def __init__(self, queue_size):
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.dropped = False
+
+class EventBroadcaster:
+    """Fan-out of (event id, payload) events from one producer to many subscribers.
+
+    publish() never blocks: if a subscriber's queue is full it is marked dropped and
+    removed, instead of letting its backlog grow without bound.
+    """
+
+    def __init__(self, queue_size=100):
+        self.queue_size = queue_size
+        self.subscribers = set()
+        self.lock = threading.Lock()
+        self.published = 0
+        self.dropped = 0
+
+    def subscribe(self):
+        subscriber = Subscriber(self.queue_size)
+        with self.lock:
+            self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self.lock:
+            self.subscribers.discard(subscriber)
+
+    def publish(self, event_id, payload):
+        with self.lock:
+            self.published += 1
+            subscribers = list(self.subscribers)
+
+        for subscriber in subscribers:
+            try:
+                subscriber.queue.put_nowait((event_id, payload))
+            except queue.Full:
+                subscriber.dropped = True
+                with self.lock:
+                    if subscriber in self.subscribers:
+                        self.subscribers.discard(subscriber)
+                        self.dropped += 1
+
+    def get_stats(self):
+        with self.lock:
+            return {
+                'subscribers': len(self.subscribers),
+                'published': self.published,
+                'dropped_subscribers': self.dropped
+            }
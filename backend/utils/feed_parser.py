@@ -0,0 +1,107 @@
+import io
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from lxml import etree
+
+# Item elements of RSS 2.0 / RSS 1.0 (RDF) and Atom, in any namespace
+ITEM_TAGS = ('{*}item', '{*}entry')
+
+# Child elements that carry the publication time, in priority order
+PUBLISHED_TAGS = ('pubDate', 'published', 'updated', 'date')
+
+def iter_feed_items(content, limit=None):
+    """Stream RSS/Atom items with lxml iterparse, stopping after limit items.
+
+    Yields compact records: {'title', 'link', 'enclosure', 'published'} where enclosure is
+    {'url', 'type'} or None and published is an ISO 8601 UTC string or None.
+    """
+    if limit is not None and limit <= 0:
+        return
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+
+    events = etree.iterparse(
+        io.BytesIO(content), events=('end',), tag=ITEM_TAGS,
+        recover=True, resolve_entities=False, no_network=True
+    )
+    count = 0
+
+    try:
+        for _, element in events:
+            record = _item_record(element)
+
+            # Items are processed once, so drop them (and their finished siblings) right away
+            element.clear(keep_tail=False)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+            if not record['title']:
+                continue
+
+            yield record
+            count += 1
+            if limit is not None and count >= limit:
+                return
+    except etree.XMLSyntaxError as e:
+        # Truncated or broken feed: keep the items read so far
+        print(f"⚠️ Feed parsing stopped early: {e}")
+
+def parse_feed(content, limit=None):
+    """List of the first limit item records of an RSS/Atom document"""
+    return list(iter_feed_items(content, limit))
+
+def _item_record(item):
+    title = link = published = None
+    enclosure = None
+
+    for child in item:
+        if not isinstance(child.tag, str):
+            continue  # Comments and processing instructions
+        name = etree.QName(child).localname
+
+        if name == 'title' and title is None:
+            title = ''.join(child.itertext()).strip()
+        elif name == 'link':
+            # RSS: <link>url</link>; Atom: <link href="url" rel="alternate|enclosure" type="...">
+            href = child.get('href')
+            rel = child.get('rel', 'alternate')
+            if href and rel == 'enclosure':
+                enclosure = enclosure or {'url': href, 'type': child.get('type', '')}
+            elif href and rel == 'alternate':
+                link = link or href.strip()
+            elif not href and child.text and not link:
+                link = child.text.strip()
+        elif name == 'guid' and not link and child.get('isPermaLink', 'true') == 'true' and child.text:
+            link = child.text.strip()
+        elif name == 'enclosure' and child.get('url'):
+            enclosure = enclosure or {'url': child.get('url'), 'type': child.get('type', '')}
+        elif name in ('content', 'thumbnail') and child.get('url') and (enclosure is None or 'image' not in enclosure['type']):
+            # Media RSS: media:content / media:thumbnail
+            media_type = child.get('type') or ('image' if name == 'thumbnail' or child.get('medium') == 'image' else '')
+            if media_type:
+                enclosure = {'url': child.get('url'), 'type': media_type}
+        elif name in PUBLISHED_TAGS and child.text:
+            candidate = _parse_time(child.text.strip())
+            if candidate and (published is None or PUBLISHED_TAGS.index(name) < published[0]):
+                published = (PUBLISHED_TAGS.index(name), candidate)
+
+    return {
+        'title': title,
+        'link': link,
+        'enclosure': enclosure,
+        'published': published[1] if published else None
+    }
+
+def _parse_time(value):
+    """RFC 822 (RSS) or ISO 8601 (Atom, Dublin Core) time as an ISO 8601 UTC string"""
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
@@ -0,0 +1,33 @@
+from html.parser import HTMLParser
+
+# Meta tags that carry an article's share image, in priority order
+IMAGE_META_TAGS = (('property', 'og:image'), ('name', 'twitter:image'))
+
+class HeadMetaParser(HTMLParser):
+    """Incremental parser that collects og:image/twitter:image from a page's <head>"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.images = {}
+        self.head_closed = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'body':
+            self.head_closed = True
+            return
+
+        if tag != 'meta':
+            return
+
+        attrs = dict(attrs)
+        for attribute, value in IMAGE_META_TAGS:
+            if attrs.get(attribute) == value and attrs.get('content') and value not in self.images:
+                self.images[value] = attrs['content']
+
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self.head_closed = True
+
+    def candidates(self):
+        """Meta image URLs found so far, in priority order"""
+        return [self.images[value] for _, value in IMAGE_META_TAGS if value in self.images]
@@ -0,0 +1,152 @@
+import base64
+import gzip
+import io
+import json
+import os
+import threading
+import time
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from config.settings import HTTP_ARCHIVE_MODE, HTTP_ARCHIVE_PATH, HTTP_REPLAY_LATENCY
+
+# Headers that describe the wire encoding; archived bodies are stored decoded
+WIRE_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection')
+
+class HttpArchive:
+    """Gzipped JSON-lines archive of HTTP exchanges for offline crawl benchmarking.
+
+    mode 'record' captures every response the shared HTTP client receives; mode 'replay'
+    serves them back (with optional artificial latency) without touching the network.
+    """
+
+    def __init__(self, path=HTTP_ARCHIVE_PATH, mode=HTTP_ARCHIVE_MODE, latency=HTTP_REPLAY_LATENCY):
+        self.path = path
+        self.mode = mode if path else ''
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.entries = None
+
+    def adapter(self, **pool_kwargs):
+        """Recording or replaying transport adapter for the active mode, or None when inactive"""
+        if self.mode == 'record':
+            return RecordingAdapter(self, **pool_kwargs)
+        if self.mode == 'replay':
+            return ReplayAdapter(self)
+        return None
+
+    def record(self, request, response, elapsed):
+        """Append one exchange to the archive"""
+        entry = {
+            'method': request.method,
+            'url': request.url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() not in WIRE_HEADERS},
+            'encoding': response.encoding,
+            'body': base64.b64encode(response.content).decode('ascii'),
+            'elapsed': round(elapsed, 4)
+        }
+
+        with self.lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Each append adds a gzip member; gzip.open reads them back as one stream
+            with gzip.open(self.path, 'at', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+
+    def lookup(self, method, url):
+        """Latest archived exchange for a request, or None"""
+        with self.lock:
+            if self.entries is None:
+                self.entries = self._load()
+        return self.entries.get((method, url))
+
+    def _load(self):
+        """Index the archive by (method, url); later recordings win"""
+        entries = {}
+        if not os.path.exists(self.path):
+            print(f"⚠️ HTTP archive {self.path} not found - replay will return 404s")
+            return entries
+
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                entry = json.loads(line)
+                # A 304 has no body to replay; keep the full response it validated
+                if entry['status'] == 304 and (entry['method'], entry['url']) in entries:
+                    continue
+                entries[(entry['method'], entry['url'])] = entry
+        return entries
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport adapter that performs real requests and archives them"""
+
+    def __init__(self, archive, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+
+    def send(self, request, **kwargs):
+        started = time.monotonic()
+        response = super().send(request, **kwargs)
+        response.content  # Read the body now so it can be archived (and still be consumed later)
+        self.archive.record(request, response, time.monotonic() - started)
+        return response
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter that answers requests from the archive, honouring conditional headers"""
+
+    def __init__(self, archive):
+        super().__init__()
+        self.archive = archive
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        entry = self.archive.lookup(request.method, request.url)
+
+        latency = self.archive.latency
+        if latency == 'recorded':
+            latency = entry['elapsed'] if entry else 0
+        if latency:
+            time.sleep(float(latency))
+
+        response = Response()
+        response.request = request
+        response.url = request.url
+        response.connection = self
+
+        if entry is None:
+            response.status_code = 404
+            response.reason = 'Not In Archive'
+            response.headers = CaseInsensitiveDict({'X-Replay-Miss': '1'})
+            response.raw = io.BytesIO(b'')
+            return response
+
+        headers = CaseInsensitiveDict(entry['headers'])
+        if self._not_modified(request, headers):
+            response.status_code = 304
+            response.reason = 'Not Modified'
+            response.headers = headers
+            response.raw = io.BytesIO(b'')
+            return response
+
+        response.status_code = entry['status']
+        response.reason = entry['reason']
+        response.headers = headers
+        response.encoding = entry['encoding']
+        response.raw = io.BytesIO(base64.b64decode(entry['body']))
+        return response
+
+    def close(self):
+        pass
+
+    def _not_modified(self, request, headers):
+        """True when the request's validators match the archived response"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        return bool(
+            (etag and request.headers.get('If-None-Match') == etag) or
+            (last_modified and request.headers.get('If-Modified-Since') == last_modified)
+        )
+
+# Global archive; inactive unless HTTP_ARCHIVE_MODE and HTTP_ARCHIVE_PATH are set
+http_archive = HttpArchive()
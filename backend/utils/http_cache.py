@@ -0,0 +1,58 @@
+import json
+import time
+from .sqlite_store import SQLiteStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    namespace TEXT NOT NULL,
+    url TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    payload TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (namespace, url)
+);
+"""
+
+class HttpCache:
+    """On-disk conditional-GET cache: ETag/Last-Modified plus the parsed result per URL"""
+
+    def __init__(self, filename='http_cache.sqlite3'):
+        self.db = SQLiteStore(filename, SCHEMA)
+
+    def lookup(self, namespace, url):
+        """Return (conditional request headers, cached payload) for a URL"""
+        rows = self.db.query(
+            'SELECT etag, last_modified, payload FROM http_cache WHERE namespace = ? AND url = ?',
+            (namespace, url)
+        )
+        if not rows:
+            return {}, None
+
+        etag, last_modified, payload = rows[0]
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        return headers, json.loads(payload)
+
+    def store(self, namespace, url, response, payload):
+        """Remember the validators and parsed payload of a 200 response"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+
+        # Without validators the server can never answer 304, so don't keep a copy
+        if not etag and not last_modified:
+            self.db.execute('DELETE FROM http_cache WHERE namespace = ? AND url = ?', (namespace, url))
+            return
+
+        self.db.execute(
+            'INSERT OR REPLACE INTO http_cache (namespace, url, etag, last_modified, payload, updated_at) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (namespace, url, etag, last_modified, json.dumps(payload), time.time())
+        )
+
+# Global cache shared by all scrapers
+http_cache = HttpCache()
@@ -0,0 +1,188 @@
+import socket
+import threading
+import time
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from config.settings import HTTP_POOL_HOSTS, HTTP_POOL_MAXSIZE, DNS_CACHE_TTL
+from .http_archive import http_archive
+
+class DnsCache:
+    """In-process getaddrinfo cache with a TTL, used when urllib3 opens a new connection"""
+
+    def __init__(self, ttl=DNS_CACHE_TTL):
+        self.ttl = ttl
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, host, port):
+        """Cached getaddrinfo results for (host, port)"""
+        key = (host, port)
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        addresses = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        with self.lock:
+            self.entries[key] = (now + self.ttl, addresses)
+        return addresses
+
+    def forget(self, host, port):
+        with self.lock:
+            self.entries.pop((host, port), None)
+
+class ClientConnection:
+    """Mixin for urllib3 connections of the shared client's pools: new sockets go through
+    the client (DNS cache, connection counting); nothing else in the process is affected"""
+    client = None
+
+    def _new_conn(self):
+        return self.client.open_connection(self, super()._new_conn)
+
+def _pool_classes(client):
+    """urllib3 pool classes whose connections belong to client"""
+    attributes = {'client': client}
+    http_connection = type('ClientHTTPConnection', (ClientConnection, HTTPConnection), attributes)
+    https_connection = type('ClientHTTPSConnection', (ClientConnection, HTTPSConnection), attributes)
+    return {
+        'http': type('ClientHTTPConnectionPool', (HTTPConnectionPool,), {'ConnectionCls': http_connection}),
+        'https': type('ClientHTTPSConnectionPool', (HTTPSConnectionPool,), {'ConnectionCls': https_connection})
+    }
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose pool manager builds the client's connection pools"""
+
+    def __init__(self, client, **kwargs):
+        self.client = client
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self.client.pool_classes
+
+class HttpClient:
+    """Shared outbound HTTP layer: one set of pooled adapters for every service, a
+    requests.Session per thread on top of them, cached DNS and connection reuse metrics"""
+
+    def __init__(self, pool_hosts=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_MAXSIZE, dns_ttl=DNS_CACHE_TTL):
+        self.pool_hosts = pool_hosts
+        self.pool_maxsize = pool_maxsize
+        self.dns_cache = DnsCache(dns_ttl) if dns_ttl > 0 else None
+        self.lock = threading.Lock()
+        self.requests = {}
+        self.connections = {}
+
+        # One adapter (and so one urllib3 pool per host) shared by all sessions;
+        # the HTTP archive swaps in its recording/replaying adapter when enabled
+        self.pool_classes = _pool_classes(self)
+        pool_kwargs = {'pool_connections': pool_hosts, 'pool_maxsize': pool_maxsize}
+        self.adapter = http_archive.adapter(**pool_kwargs) or PooledAdapter(self, **pool_kwargs)
+        if isinstance(self.adapter, HTTPAdapter) and not isinstance(self.adapter, PooledAdapter):
+            # The archive's recording adapter opens real connections too
+            self.adapter.poolmanager.pool_classes_by_scheme = self.pool_classes
+
+    def session(self, headers=None):
+        """Thread-safe session facade with its own default headers"""
+        return SharedSession(self, headers or {})
+
+    def get_stats(self):
+        """Requests, new connections and connection reuse per host, plus DNS cache hits"""
+        with self.lock:
+            hosts = {
+                host: {
+                    'requests': count,
+                    'new_connections': self.connections.get(host, 0),
+                    'reuse_ratio': round(max(0, count - self.connections.get(host, 0)) / count, 3) if count else 0
+                }
+                for host, count in self.requests.items()
+            }
+
+        total_requests = sum(host['requests'] for host in hosts.values())
+        total_connections = sum(host['new_connections'] for host in hosts.values())
+        return {
+            'requests': total_requests,
+            'new_connections': total_connections,
+            'reuse_ratio': round(max(0, total_requests - total_connections) / total_requests, 3) if total_requests else 0,
+            'dns_cache': {
+                'hits': self.dns_cache.hits,
+                'misses': self.dns_cache.misses,
+                'entries': len(self.dns_cache.entries)
+            } if self.dns_cache else None,
+            'hosts': hosts
+        }
+
+    def new_session(self, headers):
+        session = requests.Session()
+        session.headers.update(headers)
+        session.mount('http://', self.adapter)
+        session.mount('https://', self.adapter)
+        return session
+
+    def count_request(self, url):
+        host = urlparse(url).netloc
+        with self.lock:
+            self.requests[host] = self.requests.get(host, 0) + 1
+
+    def open_connection(self, connection, connect):
+        """Open a new socket for a pool connection: counted, and resolved through the DNS cache.
+
+        connect is the connection's own _new_conn; cached addresses are tried by pointing
+        its _dns_host at each one (TLS still verifies and sends SNI for the hostname).
+        """
+        host, port = connection.host, connection.port
+        with self.lock:
+            netloc = host if port in (80, 443, None) else f"{host}:{port}"
+            self.connections[netloc] = self.connections.get(netloc, 0) + 1
+
+        if self.dns_cache is None:
+            return connect()
+
+        dns_host = connection._dns_host
+        try:
+            addresses = self.dns_cache.resolve(dns_host, port)
+        except socket.gaierror:
+            return connect()
+
+        error = None
+        for _, _, _, _, sockaddr in addresses:
+            connection._dns_host = sockaddr[0]
+            try:
+                return connect()
+            except Exception as e:
+                error = e
+            finally:
+                connection._dns_host = dns_host
+
+        # None of the cached addresses answered: resolve again next time
+        self.dns_cache.forget(dns_host, port)
+        raise error
+
+class SharedSession:
+    """requests.Session look-alike that hands each thread its own session on the shared pools"""
+
+    def __init__(self, client, headers):
+        self.client = client
+        self.headers = dict(headers)
+        self.local = threading.local()
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def request(self, method, url, **kwargs):
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = self.local.session = self.client.new_session(self.headers)
+
+        self.client.count_request(url)
+        return session.request(method, url, **kwargs)
+
+# Global client used by every outbound request
+http_client = HttpClient()
@@ -0,0 +1,65 @@
+import time
+from config.settings import IMAGE_CACHE_TTL, IMAGE_CACHE_NEGATIVE_TTL, IMAGE_CACHE_MAX_ENTRIES
+from .sqlite_store import SQLiteStore
+from .url_utils import canonicalize_url
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS image_cache (
+    article_url TEXT PRIMARY KEY,
+    image_url TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS image_cache_last_access ON image_cache (last_access);
+"""
+
+class ImageCache:
+    """Persistent LRU/TTL cache of article URL -> og:image URL ("" means no image found)"""
+
+    def __init__(self, filename='image_cache.sqlite3', ttl=IMAGE_CACHE_TTL,
+                 negative_ttl=IMAGE_CACHE_NEGATIVE_TTL, max_entries=IMAGE_CACHE_MAX_ENTRIES):
+        self.db = SQLiteStore(filename, SCHEMA)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.writes_since_evict = 0
+
+    def get(self, article_url):
+        """Cached image URL, "" for a cached miss, or None when unknown or expired"""
+        key = canonicalize_url(article_url)
+        now = time.time()
+
+        rows = self.db.query('SELECT image_url, expires_at FROM image_cache WHERE article_url = ?', (key,))
+        if not rows or rows[0][1] < now:
+            return None
+
+        self.db.execute('UPDATE image_cache SET last_access = ? WHERE article_url = ?', (now, key))
+        return rows[0][0]
+
+    def put(self, article_url, image_url):
+        """Cache a lookup result; negative results expire sooner"""
+        now = time.time()
+        ttl = self.ttl if image_url else self.negative_ttl
+
+        self.db.execute(
+            'INSERT OR REPLACE INTO image_cache (article_url, image_url, expires_at, last_access) '
+            'VALUES (?, ?, ?, ?)',
+            (canonicalize_url(article_url), image_url or "", now + ttl, now)
+        )
+
+        self.writes_since_evict += 1
+        if self.writes_since_evict >= 100:
+            self.writes_since_evict = 0
+            self.evict()
+
+    def evict(self):
+        """Drop expired rows, then the least recently used beyond max_entries"""
+        self.db.execute('DELETE FROM image_cache WHERE expires_at < ?', (time.time(),))
+        self.db.execute(
+            'DELETE FROM image_cache WHERE article_url IN ('
+            'SELECT article_url FROM image_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)',
+            (self.max_entries,)
+        )
+
+# Global cache shared by all scrapers
+image_cache = ImageCache()
@@ -0,0 +1,204 @@
+import threading
+import numpy as np
+
+try:
+    # Private TextBlob tokenizer rules (checked against textblob 0.20.1); other versions may move them
+    from textblob._text import PUNCTUATION, ABBREVIATIONS, RE_ABBR1, RE_ABBR2, RE_ABBR3
+except ImportError:
+    print("⚠️ textblob._text not found - lexicon sentiment backend unavailable, using TextBlob")
+    PUNCTUATION = ABBREVIATIONS = RE_ABBR1 = RE_ABBR2 = RE_ABBR3 = None
+
+# Punctuation split off the start/end of a token ('.' is handled separately, as in TextBlob)
+LEADING_PUNCTUATION = tuple((PUNCTUATION or '').replace('.', ''))
+TRAILING_PUNCTUATION = LEADING_PUNCTUATION + ('.',)
+
+# Quotes become tokens of their own ("isn't" -> "is n ' t")
+QUOTES = str.maketrans({quote: f' {quote} ' for quote in '“”‘’\'"'})
+
+class LexiconSentimentEngine:
+    """Batch polarity scoring with TextBlob's pattern lexicon held in NumPy arrays.
+
+    Reproduces PatternAnalyzer polarity: averages the known words of a text, with a
+    preceding modifier ("very good") scaling the next word, negation ("not good")
+    flipping and halving it and '!' boosting the last assessment. The per-word state
+    machine is evaluated with cumulative sums and gathers over the whole batch.
+    Emoticons and the '(!)' irony marker are not scored.
+    """
+
+    def __init__(self):
+        self.index = None  # token -> row in the arrays below
+        self.lock = threading.Lock()
+
+    @property
+    def available(self):
+        """False when the installed TextBlob lacks the tokenizer internals this engine mirrors"""
+        return PUNCTUATION is not None
+
+    def load(self):
+        """Build the token index and lexicon arrays (once)"""
+        with self.lock:
+            if self.index is not None:
+                return
+
+            from textblob.en import sentiment as lexicon
+            words = list(lexicon.keys())  # First access loads TextBlob's lexicon
+            specials = [word for word in lexicon.negations if word not in lexicon] + ['!', "'"]
+            tokens = words + specials + [None]  # Last row: any unknown token
+            size = len(tokens)
+
+            self.polarity_values = np.zeros(size)
+            self.intensity = np.ones(size)
+            self.known = np.zeros(size, dtype=bool)
+            self.modifier = np.zeros(size, dtype=bool)
+            self.ly_modifier = np.zeros(size, dtype=bool)
+            self.negation = np.zeros(size, dtype=bool)
+
+            for row, word in enumerate(words):
+                polarity, subjectivity, intensity = lexicon[word][None]
+                self.polarity_values[row] = polarity
+                self.intensity[row] = intensity
+                self.known[row] = True
+                self.modifier[row] = any(tag in lexicon[word] for tag in lexicon.modifiers)
+                self.ly_modifier[row] = self.modifier[row] and lexicon.modifier(word)
+
+            for row, word in enumerate(tokens[:-1]):
+                self.negation[row] = word in lexicon.negations
+
+            index = {token: row for row, token in enumerate(tokens[:-1])}
+            self.bang_row = index['!']
+            self.quote_row = index["'"]
+            self.unknown_row = size - 1
+            self.index = index
+
+    def tokenize(self, text):
+        """Lowercased tokens as TextBlob's find_tokens splits them"""
+        text = text.replace("n't", " n't").translate(QUOTES)
+        tokens = []
+
+        for chunk in text.split():
+            if chunk.isalnum():
+                tokens.append(chunk.lower())
+                continue
+
+            while chunk.startswith(LEADING_PUNCTUATION):
+                tokens.append(chunk[0])
+                chunk = chunk[1:]
+
+            tail = []
+            while chunk.endswith(TRAILING_PUNCTUATION):
+                if chunk.endswith(LEADING_PUNCTUATION):
+                    tail.append(chunk[-1])
+                    chunk = chunk[:-1]
+                if chunk.endswith('...'):
+                    tail.append('...')
+                    chunk = chunk[:-3].rstrip('.')
+                if chunk.endswith('.'):
+                    if chunk in ABBREVIATIONS or RE_ABBR1.match(chunk) or RE_ABBR2.match(chunk) or RE_ABBR3.match(chunk):
+                        break
+                    tail.append('.')
+                    chunk = chunk[:-1]
+
+            if chunk:
+                tokens.append(chunk.lower())
+            tokens.extend(reversed(tail))
+
+        return tokens
+
+    def polarity(self, texts):
+        """Polarity (-1.0 to 1.0) of each text, as a float array"""
+        self.load()
+        if not texts:
+            return np.zeros(0)
+
+        token_lists = [self.tokenize(text or '') for text in texts]
+        counts = np.fromiter(map(len, token_lists), dtype=np.int64, count=len(token_lists))
+        tokens = [token for token_list in token_lists for token in token_list]
+        size = len(tokens)
+        if size == 0:
+            return np.zeros(len(texts))
+
+        lookup = self.index.get
+        unknown_row = self.unknown_row
+        rows = np.fromiter((lookup(token, unknown_row) for token in tokens), dtype=np.int64, count=size)
+        lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=size)
+
+        doc = np.repeat(np.arange(len(texts)), counts)
+        start = np.repeat(np.cumsum(counts) - counts, counts)
+        position = np.arange(size)
+
+        known = self.known[rows]
+        unknown = ~known
+        modifier = self.modifier[rows]
+        ly_modifier = self.ly_modifier[rows]
+        negation = self.negation[rows]
+
+        def last_before(mask):
+            """Position of the last True strictly before each token in its text, else -1"""
+            last = np.maximum.accumulate(np.where(mask, position, -1))
+            previous = np.concatenate(([-1], last[:-1]))
+            return np.where(previous >= start, previous, -1)
+
+        def count_between(cumulative, first, last):
+            """Tokens counted by cumulative strictly between first and last (first < last)"""
+            return cumulative[last - 1] - cumulative[np.maximum(first, 0)]
+
+        # Modifier state: set by a known modifier, cleared by longer unknown words; an
+        # unknown negation after an -ly modifier attaches to it and keeps the modifier
+        long_unknown = unknown & (lengths > 2)
+        hard_resets = np.cumsum(long_unknown & ~negation)
+        negation_resets = np.cumsum(long_unknown & negation)
+
+        previous_known = last_before(known)
+        has_previous = previous_known >= 0
+        modifier_before = has_previous & modifier[previous_known] & (count_between(hard_resets, previous_known, position) == 0)
+        ly_before = modifier_before & ly_modifier[previous_known]
+
+        chained = known & modifier_before & (ly_before | (count_between(negation_resets, previous_known, position) == 0))
+        attached = unknown & negation & ly_before
+
+        # Negation state: set by a negation, cleared by known words and longer unknown words
+        small = (lengths <= 1) | (rows == self.quote_row)
+        events = known | negation | ~small
+        last_event = last_before(events)
+        negated = known & (last_event >= 0) & negation[last_event] & ~attached[last_event]
+
+        # Assessments: a known word either starts one or extends the previous one
+        word_positions = np.flatnonzero(known)
+        if len(word_positions) == 0:
+            return np.zeros(len(texts))
+
+        starts = known & ~chained
+        entry = np.cumsum(starts) - 1
+
+        intensity = self.intensity[rows]
+        effective_intensity = np.where(negated, 1.0 / intensity, intensity)
+        word_polarity = self.polarity_values[rows]
+        scaled = np.clip(word_polarity * effective_intensity[np.maximum(previous_known, 0)], -1.0, 1.0)
+        word_polarity = np.where(chained, scaled, word_polarity)
+
+        # Each later word of an assessment overwrites its polarity: keep the last word's
+        is_last = np.append(starts[word_positions[1:]], True)
+        last_words = word_positions[is_last]
+        entry_polarity = word_polarity[last_words]
+        entry_doc = doc[last_words]
+        entry_count = len(last_words)
+
+        # '!' boosts the assessment that ends right before it
+        last_word = np.zeros(size, dtype=bool)
+        last_word[last_words] = True
+        bangs = (rows == self.bang_row) & has_previous
+        bangs &= last_word[np.maximum(previous_known, 0)]
+        boosts = np.bincount(entry[previous_known[bangs]], minlength=entry_count)
+        entry_polarity = np.clip(entry_polarity * 1.25 ** boosts, -1.0, 1.0)
+
+        # "not good" = slightly bad, "not bad" = slightly good
+        negated_entries = np.bincount(entry[word_positions], weights=negated[word_positions], minlength=entry_count)
+        negated_entries += np.bincount(entry[previous_known[attached]], minlength=entry_count)
+        entry_polarity = np.where(negated_entries > 0, entry_polarity * -0.5, entry_polarity)
+
+        totals = np.bincount(entry_doc, weights=entry_polarity, minlength=len(texts))
+        entries = np.bincount(entry_doc, minlength=len(texts))
+        return totals / np.maximum(entries, 1)
+
+# Global engine; the lexicon is loaded on first use
+lexicon_sentiment = LexiconSentimentEngine()
@@ -0,0 +1,220 @@
+import hashlib
+import re
+import threading
+from urllib.parse import urlparse
+from config.settings import NEAR_DUPLICATE_THRESHOLD, NEAR_DUPLICATE_CONTAINMENT
+from config.patterns import PATTERN_SETS
+
+# Mersenne prime for the universal hash family used as MinHash permutations
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# "Reuters: ..." / "... - BBC News" / "... | CNN": a short source or section label
+_LABEL_PREFIX = re.compile(r"^\s*[^:|]{1,25}:\s+(?=\S+(?:\s+\S+){2})")
+_LABEL_SUFFIX = re.compile(r"(?<=\S)\s+[-|\u2013\u2014]\s+[^-|\u2013\u2014]{1,25}$")
+
+# Words that carry no story identity; dropping them keeps short headlines comparable
+STOPWORDS = frozenset([
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in', 'is',
+    'it', 'its', 'of', 'on', 'or', 'over', 'says', 'that', 'the', 'this', 'to', 'was', 'will', 'with'
+])
+
+def shingles(text):
+    """Word unigrams and bigrams of a normalized headline (without a leading or trailing source label)"""
+    text = _LABEL_SUFFIX.sub('', _LABEL_PREFIX.sub('', text))
+    tokens = [token for token in _TOKEN.findall(text.lower()) if token not in STOPWORDS]
+    return set(tokens) | {f"{first} {second}" for first, second in zip(tokens, tokens[1:])}
+
+def similarity(first, second):
+    """(Jaccard similarity, containment of the smaller shingle set in the larger) of two shingle sets"""
+    if not first or not second:
+        return 0.0, 0.0
+    shared = len(first & second)
+    return shared / len(first | second), shared / min(len(first), len(second))
+
+# Smallest shingle set (three words: 3 unigrams + 2 bigrams) that may match by containment
+MIN_CONTAINED_SHINGLES = 5
+
+# Display names of well-known sources; others fall back to their domain
+SOURCE_NAMES = {
+    'reuters.com': 'Reuters',
+    'bbc.co.uk': 'BBC',
+    'cnn.com': 'CNN',
+    'techcrunch.com': 'TechCrunch',
+    'theverge.com': 'The Verge',
+    'arstechnica.com': 'Ars Technica',
+    'bloomberg.com': 'Bloomberg',
+    'espn.com': 'ESPN'
+}
+
+def source_name(url):
+    """Readable source name for an article or feed URL"""
+    for domain, name in SOURCE_NAMES.items():
+        if domain in (url or ''):
+            return name
+    domain = urlparse(url or '').netloc
+    return domain.replace('www.', '').replace('feeds.', '').title() or 'News Source'
+
+def source_entry(url, name=None):
+    """One alternate source as stored and served: {'source': name, 'source_url': url}"""
+    return {'source': name or source_name(url), 'source_url': url}
+
+def source_rank(url):
+    """Source quality rank from the source_domains patterns: 0 best, 3 questionable"""
+    domain = urlparse(url or '').netloc.lower()
+    tiers = PATTERN_SETS['source_domains']
+    for rank, tier in enumerate(('tier1', 'tier2')):
+        if any(domain == name or domain.endswith('.' + name) for name in tiers.get(tier, [])):
+            return rank
+    if any(domain == name or domain.endswith('.' + name) for name in tiers.get('questionable', [])):
+        return 3
+    return 2
+
+class MinHashLSH:
+    """MinHash signatures with banded locality-sensitive hashing.
+
+    Candidates for a headline come from the buckets its bands fall into, so a lookup
+    costs the same regardless of how many headlines are indexed.
+    """
+
+    def __init__(self, num_perm=64, bands=32, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.permutations = [
+            (int.from_bytes(hashlib.blake2b(f"{seed}-{i}-a".encode(), digest_size=8).digest(), 'little') % _PRIME | 1,
+             int.from_bytes(hashlib.blake2b(f"{seed}-{i}-b".encode(), digest_size=8).digest(), 'little') % _PRIME)
+            for i in range(num_perm)
+        ]
+        self.buckets = {}
+        self.signatures = {}
+
+    def signature(self, features):
+        if not features:
+            return None
+        hashes = [int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'little')
+                  for feature in features]
+        return tuple(
+            min(((a * h + b) % _PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self.permutations
+        )
+
+    def add(self, key, signature):
+        self.signatures[key] = signature
+        for band in self._bands(signature):
+            self.buckets.setdefault(band, []).append(key)
+
+    def query(self, signature):
+        """Indexed keys sharing at least one band with the signature (candidates to confirm)"""
+        return {key for band in self._bands(signature) for key in self.buckets.get(band, ())}
+
+    def _bands(self, signature):
+        return [(band, signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+
+class StoryDeduplicator:
+    """Groups headlines from different sources into stories and keeps the best-sourced one.
+
+    LSH candidates are confirmed on their exact shingle sets: two headlines are one story
+    when their Jaccard similarity reaches threshold, or when one is (almost) contained in
+    the other ("Oil prices climb" / "Oil prices climb on supply fears"). A swapped word
+    ("rise" / "fall", "Kyiv" / "Odesa") keeps them apart.
+
+    offer() admits the first headline of a story, and a later one only if it ranks better
+    (lower rank); the others are recorded as the story's alternate sources.
+    """
+
+    def __init__(self, threshold=NEAR_DUPLICATE_THRESHOLD, containment=NEAR_DUPLICATE_CONTAINMENT,
+                 num_perm=64, bands=32):
+        self.threshold = threshold
+        self.containment = containment
+        self.index = MinHashLSH(num_perm, bands)
+        self.lock = threading.Lock()
+        self.stories = []  # [{'best': (rank, key, source), 'members': {key: source}}]
+        self.story_of = {}
+        self.features = {}  # key -> shingle set, for the exact check
+        self.duplicates = 0
+
+    def offer(self, key, text, source, rank):
+        """Record a headline; True if it is (now) the best version of its story"""
+        with self.lock:
+            features = shingles(text)
+            signature = self.index.signature(features)
+            matches = self._confirmed(features, self.index.query(signature)) if signature else []
+
+            if not matches:
+                story = {'best': (rank, key, source), 'members': {key: source}}
+                self.stories.append(story)
+                self.story_of[key] = story
+                if signature:
+                    self.features[key] = features
+                    self.index.add(key, signature)
+                return True
+
+            story = self.story_of[matches[0]]
+            story['members'][key] = source
+            self.story_of[key] = story
+            self.features[key] = features
+            self.index.add(key, signature)  # Later variants can match through this one too
+            self.duplicates += 1
+
+            if (rank, key) < story['best'][:2]:
+                story['best'] = (rank, key, source)
+                return True
+            return False
+
+    def _confirmed(self, features, candidates):
+        """Candidates that really are the same story, most similar first"""
+        matches = []
+        for candidate in candidates:
+            other = self.features[candidate]
+            jaccard, containment = similarity(features, other)
+            # Containment only counts for headlines long enough to say something specific
+            if min(len(features), len(other)) < MIN_CONTAINED_SHINGLES:
+                containment = 0.0
+            if jaccard >= self.threshold or containment >= self.containment:
+                matches.append((jaccard, containment, candidate))
+        return [candidate for jaccard, containment, candidate in sorted(matches, reverse=True)]
+
+    def is_best(self, key):
+        """True while the headline is still the chosen version of its story"""
+        with self.lock:
+            story = self.story_of.get(key)
+            return story is None or story['best'][1] == key
+
+    def alternates(self, key):
+        """Sources of the story's other versions"""
+        with self.lock:
+            story = self.story_of.get(key)
+            if story is None:
+                return []
+            return [source for member, source in story['members'].items() if member != key]
+
+    def deduplicate(self, items, text, source, rank, limit=None):
+        """Best-sourced copy of each story (with 'alternate_sources'), in the order the stories
+        first appear. items may be a lazy iterable; it is consumed only until limit stories
+        have been seen, so an ordered stream costs about limit MinHash signatures.
+        """
+        seen = []
+        firsts = []  # Position of each story's first item
+        if limit is not None and limit <= 0:
+            return []
+
+        for position, item in enumerate(items):
+            seen.append(item)
+            story_count = len(self.stories)
+            self.offer(position, text(item), source(item), (rank(item), position))
+            if len(self.stories) > story_count:
+                firsts.append(position)
+                if len(firsts) == limit:
+                    break  # Without pulling another item from the stream
+
+        unique = []
+        for position in firsts:
+            with self.lock:
+                best = self.story_of[position]['best'][1]
+            unique.append(dict(seen[best], alternate_sources=self.alternates(best)))
+        return unique
@@ -0,0 +1,83 @@
+from collections import deque
+
+class PatternMatcher:
+    """Aho-Corasick automaton over categorized substring patterns.
+
+    Built once; each scan is a single pass over the text regardless of how many
+    patterns there are. Matching is case-insensitive (patterns and text are lowercased).
+    """
+
+    def __init__(self, patterns_by_category):
+        self.goto = [{}]
+        self.fail = [0]
+        self.outputs = [[]]  # (pattern, category) pairs ending at each state
+
+        for category, patterns in patterns_by_category.items():
+            for pattern in patterns:
+                if pattern:
+                    self._add(pattern.lower(), category)
+
+        self._build_failure_links()
+
+    def find(self, text):
+        """Return {category: set(matched patterns)} for every pattern found in text"""
+        found = {}
+        for pattern, category in self._scan(text):
+            found.setdefault(category, set()).add(pattern)
+        return found
+
+    def count(self, text):
+        """Return {category: number of distinct patterns found in text}"""
+        return {category: len(patterns) for category, patterns in self.find(text).items()}
+
+    def matches_any(self, text, category=None):
+        """True as soon as any pattern (optionally of one category) is found"""
+        for _, matched_category in self._scan(text):
+            if category is None or matched_category == category:
+                return True
+        return False
+
+    def _add(self, pattern, category):
+        """Insert a pattern into the trie"""
+        state = 0
+        for char in pattern:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+            state = next_state
+        self.outputs[state].append((pattern, category))
+
+    def _build_failure_links(self):
+        """Breadth-first pass that links each state to its longest proper suffix state"""
+        queue = deque(self.goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+
+                # A state also reports every pattern that ends at its suffix state
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.fail[next_state]]
+
+    def _scan(self, text):
+        """Yield (pattern, category) for every occurrence in text"""
+        if not text:
+            return
+
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                yield from outputs[state]
@@ -0,0 +1,134 @@
+import threading
+import time
+from urllib.parse import urlparse
+from config.settings import (
+    HOST_REQUEST_RATE, HOST_REQUEST_BURST, HOST_MAX_CONCURRENCY,
+    HOST_MIN_REQUEST_RATE, HOST_SLOW_RESPONSE_SECONDS
+)
+
+# Statuses that mean the host wants us to slow down
+THROTTLE_STATUSES = (403, 429)
+
+class _HostState:
+    """Token bucket, concurrency cap and health signals for a single host"""
+
+    def __init__(self, rate, burst, max_concurrency):
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.latency = None  # EWMA of response time in seconds
+        self.throttle_ratio = 0.0  # EWMA of 403/429 responses
+        self.requests = 0
+        self.in_flight = 0
+
+class HostRequestScheduler:
+    """Shared per-host politeness scheduler: token bucket + concurrency cap per host,
+    with AIMD backoff on 403/429 responses and slow replies"""
+
+    def __init__(self, rate=HOST_REQUEST_RATE, burst=HOST_REQUEST_BURST,
+                 max_concurrency=HOST_MAX_CONCURRENCY, min_rate=HOST_MIN_REQUEST_RATE,
+                 slow_response=HOST_SLOW_RESPONSE_SECONDS):
+        self.max_rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_rate = min_rate
+        self.slow_response = slow_response
+        self.hosts = {}
+        self.lock = threading.Lock()
+
+    def get(self, session, url, **kwargs):
+        """Issue session.get(url) once the host has a free slot and a token"""
+        state = self._state(url)
+
+        with state.slots:
+            self._acquire_token(state)
+
+            with state.lock:
+                state.in_flight += 1
+            started = time.monotonic()
+            try:
+                response = session.get(url, **kwargs)
+            except Exception:
+                self._record(state, None, time.monotonic() - started)
+                raise
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+
+            self._record(state, response, time.monotonic() - started)
+            return response
+
+    def get_stats(self):
+        """Current per-host rate, latency and throttling figures"""
+        with self.lock:
+            hosts = dict(self.hosts)
+
+        stats = {}
+        for host, state in hosts.items():
+            with state.lock:
+                stats[host] = {
+                    'rate': round(state.rate, 3),
+                    'in_flight': state.in_flight,
+                    'requests': state.requests,
+                    'latency_ms': round(state.latency * 1000, 1) if state.latency is not None else None,
+                    'throttle_ratio': round(state.throttle_ratio, 3)
+                }
+        return stats
+
+    def _state(self, url):
+        """Get or create the state for the URL's host"""
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            state = self.hosts.get(host)
+            if state is None:
+                state = _HostState(self.max_rate, self.burst, self.max_concurrency)
+                self.hosts[host] = state
+            return state
+
+    def _acquire_token(self, state):
+        """Reserve a token, sleeping outside the lock until it becomes available"""
+        with state.lock:
+            now = time.monotonic()
+            state.tokens = min(state.burst, state.tokens + (now - state.updated) * state.rate)
+            state.updated = now
+            state.tokens -= 1
+
+            # A negative balance is a reservation: wait until it has refilled
+            wait = max(-state.tokens / state.rate, state.blocked_until - now, 0)
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def _record(self, state, response, elapsed):
+        """Update health signals and adapt the host's rate (AIMD)"""
+        status = response.status_code if response is not None else None
+        throttled = status in THROTTLE_STATUSES
+
+        with state.lock:
+            state.requests += 1
+            state.latency = elapsed if state.latency is None else 0.8 * state.latency + 0.2 * elapsed
+            state.throttle_ratio = 0.8 * state.throttle_ratio + (0.2 if throttled else 0.0)
+
+            if throttled:
+                state.rate = max(self.min_rate, state.rate * 0.5)
+                retry_after = self._retry_after(response)
+                if retry_after:
+                    state.blocked_until = time.monotonic() + retry_after
+            elif response is None or state.latency > self.slow_response:
+                state.rate = max(self.min_rate, state.rate * 0.75)
+            elif state.throttle_ratio < 0.05:
+                state.rate = min(self.max_rate, state.rate + self.max_rate * 0.1)
+
+    def _retry_after(self, response):
+        """Seconds requested by a Retry-After header, if it is numeric"""
+        try:
+            return min(float(response.headers.get('Retry-After', 0)), 60)
+        except (TypeError, ValueError):
+            return 0
+
+# Global scheduler shared by all scrapers
+request_scheduler = HostRequestScheduler()
@@ -0,0 +1,44 @@
+import threading
+from collections import deque
+
+class SequencedRingBuffer:
+    """Bounded, thread-safe log of items stamped with increasing sequence numbers.
+
+    Readers keep the last sequence number they saw as a cursor and ask for what came after it.
+    """
+
+    def __init__(self, capacity=500, start_seq=0):
+        self.items = deque(maxlen=capacity)  # (seq, item); oldest entries fall off the left
+        self.last_seq = start_seq
+        self.condition = threading.Condition()
+
+    def append(self, item):
+        """Add an item and return its sequence number"""
+        with self.condition:
+            self.last_seq += 1
+            self.items.append((self.last_seq, item))
+            self.condition.notify_all()
+            return self.last_seq
+
+    def since(self, cursor, limit=None):
+        """([(seq, item)] newer than cursor, oldest first; new cursor; True if items were missed)
+
+        A cursor older than the oldest buffered item means the reader fell behind the
+        buffer and missed items; a cursor ahead of the log (e.g. after a restart) starts over.
+        """
+        with self.condition:
+            if cursor > self.last_seq:
+                cursor = 0
+            oldest = self.items[0][0] if self.items else self.last_seq + 1
+            missed = 0 < cursor and cursor + 1 < oldest
+
+            newer = [entry for entry in self.items if entry[0] > cursor]
+            if limit is not None:
+                newer = newer[:limit]
+
+            next_cursor = newer[-1][0] if newer else cursor
+            return newer, next_cursor, missed
+
+    def __len__(self):
+        with self.condition:
+            return len(self.items)
@@ -0,0 +1,110 @@
+import hashlib
+import json
+import math
+import threading
+import time
+from config.settings import SEEN_INDEX_CAPACITY, SEEN_INDEX_FALSE_POSITIVE_RATE, SEEN_INDEX_TTL
+from .sqlite_store import SQLiteStore
+from .url_utils import canonicalize_url, headline_hash, article_key
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen_articles (
+    article_key TEXT PRIMARY KEY,
+    article_url TEXT NOT NULL,
+    headline_hash TEXT NOT NULL,
+    news_item TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS seen_articles_last_seen ON seen_articles (last_seen);
+"""
+
+class BloomFilter:
+    """Fixed-size Bloom filter: no false negatives, tunable false-positive rate"""
+
+    def __init__(self, capacity, false_positive_rate):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.lock = threading.Lock()
+
+    def add(self, key):
+        with self.lock:
+            for position in self._positions(key):
+                self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def _positions(self, key):
+        """k bit positions from two 64-bit hashes (Kirsch-Mitzenmacher double hashing)"""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+class SeenArticleIndex:
+    """Persistent index of processed articles (canonical URL + headline hash): a Bloom
+    filter in front of SQLite, which keeps each article's enriched news item"""
+
+    def __init__(self, filename='seen_articles.sqlite3', capacity=SEEN_INDEX_CAPACITY,
+                 false_positive_rate=SEEN_INDEX_FALSE_POSITIVE_RATE, ttl=SEEN_INDEX_TTL):
+        self.db = SQLiteStore(filename, SCHEMA)
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.ttl = ttl
+        self.prune()
+
+    def get(self, article_url, headline):
+        """Stored news item for a known article, or None if it is new"""
+        key = article_key(article_url, headline)
+        if key not in self.bloom:
+            return None
+
+        rows = self.db.query('SELECT news_item FROM seen_articles WHERE article_key = ?', (key,))
+        if not rows:
+            return None  # Bloom filter false positive
+
+        self.db.execute('UPDATE seen_articles SET last_seen = ? WHERE article_key = ?', (time.time(), key))
+        return json.loads(rows[0][0])
+
+    def alternate_sources(self, article_url, headline):
+        """Other sources ({'source', 'source_url'} dicts) recorded for a known article's story
+        ([] if none or unknown); read-only"""
+        key = article_key(article_url, headline)
+        if key not in self.bloom:
+            return []
+
+        rows = self.db.query('SELECT news_item FROM seen_articles WHERE article_key = ?', (key,))
+        if not rows:
+            return []
+        return json.loads(rows[0][0]).get('alternate_sources', [])
+
+    def add(self, news_item):
+        """Record a processed article together with its enriched data"""
+        article_url = news_item.get('source_url', '')
+        headline = news_item['headline']
+        key = article_key(article_url, headline)
+        now = time.time()
+
+        self.db.execute(
+            'INSERT INTO seen_articles (article_key, article_url, headline_hash, news_item, first_seen, last_seen) '
+            'VALUES (?, ?, ?, ?, ?, ?) '
+            'ON CONFLICT(article_key) DO UPDATE SET news_item = excluded.news_item, last_seen = excluded.last_seen',
+            (key, canonicalize_url(article_url), headline_hash(headline), json.dumps(news_item), now, now)
+        )
+        self.bloom.add(key)
+
+    def prune(self):
+        """Forget articles not seen within the TTL and rebuild the Bloom filter"""
+        self.db.execute('DELETE FROM seen_articles WHERE last_seen < ?', (time.time() - self.ttl,))
+
+        keys = [row[0] for row in self.db.query('SELECT article_key FROM seen_articles')]
+        bloom = BloomFilter(max(self.capacity, len(keys) * 2), self.false_positive_rate)
+        for key in keys:
+            bloom.add(key)
+        self.bloom = bloom
+
+# Global index used by the crawl
+seen_index = SeenArticleIndex()
@@ -0,0 +1,105 @@
+import threading
+
+class _Call:
+    """One in-flight computation and the callers waiting for it"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+class SingleFlight:
+    """Keyed request coalescing: concurrent calls with the same key share one execution.
+
+    The first caller runs the function; callers arriving while it runs wait and receive
+    the same result (or exception). Keys look like 'group' or 'group:detail'; metrics are
+    kept per group.
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self.stats = {}
+        self.lock = threading.Lock()
+
+    def do(self, key, func, *args, wait_timeout=None, **kwargs):
+        """Run func once for all concurrent callers with this key and return its result.
+
+        wait_timeout bounds how long a caller that joins a running call waits for it;
+        past that it gets TimeoutError while the call carries on for the others.
+        """
+        with self.lock:
+            stats = self._group_stats(key)
+            stats['requests'] += 1
+            call = self.calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                stats['coalesced'] += 1
+                leader = False
+            else:
+                call = self.calls[key] = _Call()
+                stats['executions'] += 1
+                leader = True
+
+        if not leader:
+            if not call.done.wait(wait_timeout):
+                with self.lock:
+                    call.waiters -= 1
+                    stats['timeouts'] += 1
+                raise TimeoutError(f"{key} still running after {wait_timeout}s")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.done.set()
+
+    def do_async(self, key, func, *args, **kwargs):
+        """Start func in a background thread unless a call with this key is already running"""
+        with self.lock:
+            if key in self.calls:
+                stats = self._group_stats(key)
+                stats['requests'] += 1
+                stats['coalesced'] += 1
+                return False
+
+        def run():
+            try:
+                self.do(key, func, *args, **kwargs)
+            except Exception as e:
+                print(f"❌ Background {key} failed: {e}")
+
+        threading.Thread(target=run, daemon=True).start()
+        return True
+
+    def in_flight(self, key):
+        with self.lock:
+            return key in self.calls
+
+    def get_stats(self):
+        """Requests, executions, coalesced requests and waiter timeouts per key group"""
+        with self.lock:
+            in_flight = {}
+            for key in self.calls:
+                group = key.split(':', 1)[0]
+                in_flight[group] = in_flight.get(group, 0) + 1
+
+            return {
+                group: dict(stats, in_flight=in_flight.get(group, 0))
+                for group, stats in self.stats.items()
+            }
+
+    def _group_stats(self, key):
+        group = key.split(':', 1)[0]
+        return self.stats.setdefault(group, {'requests': 0, 'executions': 0, 'coalesced': 0, 'timeouts': 0})
+
+# Global coalescer for the expensive endpoints (live feed, bulk download, crawl)
+single_flight = SingleFlight()
@@ -0,0 +1,30 @@
+import os
+import sqlite3
+import threading
+from config.settings import CACHE_DIR
+
+class SQLiteStore:
+    """Thread-safe SQLite database under CACHE_DIR for small persistent caches"""
+
+    def __init__(self, filename, schema):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        self.path = os.path.join(CACHE_DIR, filename)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+
+        with self.lock:
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.executescript(schema)
+            self.connection.commit()
+
+    def query(self, sql, params=()):
+        """Run a read query and return all rows"""
+        with self.lock:
+            return self.connection.execute(sql, params).fetchall()
+
+    def execute(self, sql, params=()):
+        """Run a write statement and commit it"""
+        with self.lock:
+            cursor = self.connection.execute(sql, params)
+            self.connection.commit()
+            return cursor.rowcount
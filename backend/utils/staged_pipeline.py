@@ -0,0 +1,161 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+class PipelineStage:
+    """One pipeline stage: a blocking handler, its worker count and a bounded input queue.
+
+    handler(item) returns an iterable of items for the next stage (or None to drop the item).
+    A batch stage instead collects everything its upstream produces and calls handler(items)
+    once, after the upstream stages have drained.
+    """
+
+    def __init__(self, name, handler, workers=1, queue_size=32, batch=False):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.queue_size = queue_size
+        self.batch = batch
+        self.lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.pending = []  # Items collected by a batch stage
+        self.processed = 0
+        self.emitted = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+
+    def record(self, elapsed, emitted=0, failed=False, count=1):
+        with self.lock:
+            self.processed += count
+            self.emitted += emitted
+            self.errors += count if failed else 0
+            self.busy_seconds += elapsed
+
+class StagedPipeline:
+    """Asyncio pipeline of stages connected by bounded queues.
+
+    Each stage runs its own pool of worker tasks; handlers are blocking calls executed
+    in a thread pool, so a full downstream queue makes upstream workers wait (backpressure).
+    """
+
+    def __init__(self, stages):
+        self.stages = stages
+        self.queues = []
+        self.started = None
+        self.finished = None
+
+    def run(self, items):
+        """Push items through every stage and return what the last stage emits"""
+        for stage in self.stages:
+            stage.reset_stats()
+        return asyncio.run(self._run(list(items)))
+
+    def get_stats(self):
+        """Per-stage counters: throughput, busy time and queue depth"""
+        elapsed = ((self.finished or time.monotonic()) - self.started) if self.started else 0
+        stats = {'elapsed_seconds': round(elapsed, 3), 'stages': {}}
+
+        for stage, queue in zip(self.stages, self.queues or [None] * len(self.stages)):
+            stats['stages'][stage.name] = {
+                'workers': stage.workers,
+                'processed': stage.processed,
+                'emitted': stage.emitted,
+                'errors': stage.errors,
+                'queue_depth': queue.qsize() if queue else 0,
+                'max_queue_depth': stage.max_queue_depth,
+                'busy_seconds': round(stage.busy_seconds, 3),
+                # Busy time per worker relative to wall clock: ~1.0 marks the limiting stage
+                'utilization': round(stage.busy_seconds / (elapsed * stage.workers), 3) if elapsed else 0,
+                'items_per_second': round(stage.processed / elapsed, 2) if elapsed else 0
+            }
+        return stats
+
+    async def _run(self, items):
+        self.started = time.monotonic()
+        self.finished = None
+        self.queues = [asyncio.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        results = []
+
+        thread_count = sum(stage.workers for stage in self.stages)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=thread_count) as executor:
+            workers = []
+            for index, stage in enumerate(self.stages):
+                output = self.queues[index + 1] if index + 1 < len(self.stages) else results
+                workers.append([
+                    asyncio.create_task(self._worker(executor, stage, self.queues[index], output))
+                    for _ in range(stage.workers)
+                ])
+
+            for item in items:
+                await self._put(self.stages[0], self.queues[0], item)
+
+            # Stages drain in order: once stage N is idle nothing new can reach stage N+1
+            for index, (stage, queue, stage_workers) in enumerate(zip(self.stages, self.queues, workers)):
+                await queue.join()
+                for task in stage_workers:
+                    task.cancel()
+                await asyncio.gather(*stage_workers, return_exceptions=True)
+
+                if stage.batch:
+                    output = self.queues[index + 1] if index + 1 < len(self.stages) else results
+                    await self._run_batch(executor, stage, output)
+
+        self.finished = time.monotonic()
+        return results
+
+    async def _worker(self, executor, stage, queue, output):
+        """Take items from the stage queue, run the handler and pass its outputs on"""
+        loop = asyncio.get_running_loop()
+        next_stage = self.stages[self.stages.index(stage) + 1] if isinstance(output, asyncio.Queue) else None
+
+        while True:
+            item = await queue.get()
+            if stage.batch:
+                stage.pending.append(item)
+                queue.task_done()
+                continue
+
+            started = time.monotonic()
+            try:
+                produced = list(await loop.run_in_executor(executor, stage.handler, item) or [])
+                stage.record(time.monotonic() - started, emitted=len(produced))
+                await self._emit(next_stage, output, produced)
+
+            except Exception as e:
+                stage.record(time.monotonic() - started, failed=True)
+                print(f"Error in {stage.name} stage: {e}")
+            finally:
+                queue.task_done()
+
+    async def _run_batch(self, executor, stage, output):
+        """Call a batch stage's handler once with every item it collected"""
+        items, stage.pending = stage.pending, []
+        if not items:
+            return
+
+        loop = asyncio.get_running_loop()
+        next_stage = self.stages[self.stages.index(stage) + 1] if isinstance(output, asyncio.Queue) else None
+        started = time.monotonic()
+        try:
+            produced = list(await loop.run_in_executor(executor, stage.handler, items) or [])
+            stage.record(time.monotonic() - started, emitted=len(produced), count=len(items))
+            await self._emit(next_stage, output, produced)
+        except Exception as e:
+            stage.record(time.monotonic() - started, failed=True, count=len(items))
+            print(f"Error in {stage.name} stage: {e}")
+
+    async def _emit(self, next_stage, output, produced):
+        for next_item in produced:
+            if next_stage is None:
+                output.append(next_item)
+            else:
+                await self._put(next_stage, output, next_item)
+
+    async def _put(self, stage, queue, item):
+        """Enqueue for a stage, waiting while its queue is full"""
+        await queue.put(item)
+        stage.max_queue_depth = max(stage.max_queue_depth, queue.qsize())
@@ -0,0 +1,46 @@
+import hashlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that only track the click and never change the article; matched
+# exactly, except for the utm_* family ('ref' must not also strip 'refid' or 'reference')
+TRACKING_PARAMS = frozenset(['fbclid', 'gclid', 'mc_cid', 'mc_eid', 'cmpid', 'ocid', 'ref'])
+TRACKING_PREFIXES = ('utm_',)
+
+def is_tracking_param(key):
+    """True for a query parameter that only tracks the click"""
+    key = key.lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES)
+
+def canonicalize_url(url):
+    """Normalize an article URL so the same page always maps to the same key"""
+    if not url:
+        return ""
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if (scheme == 'http' and host.endswith(':80')) or (scheme == 'https' and host.endswith(':443')):
+        host = host.rsplit(':', 1)[0]
+
+    path = parts.path or '/'
+    if len(path) > 1 and path.endswith('/'):
+        path = path.rstrip('/')
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not is_tracking_param(key)
+    )
+
+    # Fragments never reach the server, so they are dropped
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+def headline_hash(headline):
+    """Hash of the headline with case and whitespace normalized"""
+    normalized = ' '.join(headline.lower().split())
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+def article_key(article_url, headline):
+    """Article identity: canonical article URL plus headline hash"""
+    return f"{canonicalize_url(article_url)}#{headline_hash(headline)}"
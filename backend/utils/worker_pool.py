@@ -0,0 +1,142 @@
+import concurrent.futures
+import math
+import multiprocessing
+import threading
+from config.settings import CRAWL_PROCESS_WORKERS, CPU_CHUNK_SIZE, CPU_MIN_CHUNK_SIZE
+
+def _ready():
+    """No-op task: makes a worker fork and run its warmers"""
+    return True
+
+def _run_warmers(warmers):
+    """Worker initializer: load lexicons, parsers and other per-process state once"""
+    for warmer in warmers:
+        try:
+            warmer()
+        except Exception as e:
+            print(f"⚠️ Worker warm-up {warmer.__name__} failed: {e}")
+
+class WarmProcessPool:
+    """Long-lived process pool for CPU-bound work (parsing, sentiment scoring).
+
+    Workers start once, in start(), and run every registered warmer before taking work,
+    so each task finds its lexicons and parsers already loaded. Lists are sent in chunks
+    to keep IPC per item low. Until start() runs, with workers=0, or for good once the
+    pool breaks, work runs inline in the calling thread: forking later, from a process
+    that already runs threads, could copy a lock another thread holds.
+    """
+
+    def __init__(self, workers=CRAWL_PROCESS_WORKERS, chunk_size=CPU_CHUNK_SIZE, min_chunk_size=CPU_MIN_CHUNK_SIZE):
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.min_chunk_size = min_chunk_size
+        self.warmers = []
+        self.executor = None
+        self.broken = False  # Set once a worker dies; work then stays inline
+        self.lock = threading.Lock()
+        self.stats = {'tasks': 0, 'chunks': 0, 'inline': 0, 'failures': 0}
+
+    def add_warmer(self, warmer):
+        """Register a module-level function every worker runs once at start-up"""
+        if warmer not in self.warmers:
+            self.warmers.append(warmer)
+
+    @property
+    def enabled(self):
+        return self.workers > 0
+
+    def start(self):
+        """Fork the workers and wait until each has warmed up.
+
+        Call it before the app starts other threads: fork copies only the calling
+        thread, so a lock another thread holds at that moment stays held in the worker.
+        """
+        with self.lock:
+            if not self.enabled or self.broken or self.executor is not None:
+                return self.executor
+
+            # fork keeps workers from re-importing the app (and reconnecting to the databases)
+            context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=context,
+                initializer=_run_warmers, initargs=(tuple(self.warmers),)
+            )
+
+            # The executor only forks on its first submit: one no-op per worker forks
+            # them all now, and waiting on them means the warmers have run
+            for future in [executor.submit(_ready) for _ in range(self.workers)]:
+                future.result()
+
+            self.executor = executor
+            print(f"✅ CPU worker pool started ({self.workers} processes)")
+            return self.executor
+
+    def run(self, func, *args):
+        """func(*args) in a worker process, or inline when the pool isn't running"""
+        executor = self.executor
+        if executor is None:
+            self._count('inline')
+            return func(*args)
+
+        try:
+            self._count('tasks')
+            return executor.submit(func, *args).result()
+        except concurrent.futures.process.BrokenProcessPool as e:
+            self._fall_back(executor, e)
+            self._count('inline')
+            return func(*args)
+
+    def map_chunks(self, func, items, chunk_size=None):
+        """Concatenated func(chunk) results for items split into chunks across the workers.
+
+        func takes a list and returns a list of the same length. Lists too small to be
+        worth the IPC run inline.
+        """
+        items = list(items)
+        executor = self.executor
+        if executor is None or len(items) <= self.min_chunk_size:
+            self._count('inline')
+            return func(items)
+
+        # Enough chunks to keep every worker busy, none larger than chunk_size
+        size = chunk_size or max(self.min_chunk_size, min(self.chunk_size, math.ceil(len(items) / self.workers)))
+        chunks = [items[start:start + size] for start in range(0, len(items), size)]
+
+        try:
+            futures = [executor.submit(func, chunk) for chunk in chunks]
+            with self.lock:
+                self.stats['tasks'] += 1
+                self.stats['chunks'] += len(chunks)
+            return [result for future in futures for result in future.result()]
+        except concurrent.futures.process.BrokenProcessPool as e:
+            self._fall_back(executor, e)
+            self._count('inline')
+            return func(items)
+
+    def shutdown(self):
+        """Stop the workers once their current tasks finish"""
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def get_stats(self):
+        with self.lock:
+            return dict(self.stats, workers=self.workers, running=self.executor is not None, broken=self.broken)
+
+    def _fall_back(self, executor, error):
+        """Drop a broken pool and run inline from now on (re-forking now could copy a held lock)"""
+        print(f"⚠️ CPU worker pool broke ({error}), running inline from now on")
+        with self.lock:
+            self.broken = True
+            if self.executor is executor:
+                self.executor = None
+                self.stats['failures'] += 1
+        executor.shutdown(wait=False)
+
+    def _count(self, name):
+        with self.lock:
+            self.stats[name] += 1
+
+# Global pool shared by the crawl's parse stage and the sentiment analyzer
+cpu_pool = WarmProcessPool()